@@ -5,17 +5,32 @@ This script sets up your Trello board with the necessary lists and labels for th
 """
 
 import os
-from dotenv import load_dotenv
+import re
 import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from dotenv import load_dotenv
 
-from trello import TrelloClient
-from trello.exceptions import ResourceUnavailable
+# Guarded path mutation: only insert src/ once, even if this module is
+# imported repeatedly.
+_SRC = str(Path(__file__).resolve().parent.parent / 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 # Load environment variables
 load_dotenv()
 
+# Matches the board ID in URLs like https://trello.com/b/Diz3GQos/mcp-practice
+_BOARD_ID_RE = re.compile(r'/b/([a-zA-Z0-9]+)')
+
+
+def _try_create(create, *args):
+    """Call a Trello create function, returning the result or the exception."""
+    try:
+        return create(*args)
+    except Exception as e:
+        return e
+
 def setup_trello_board():
     """Set up the Trello board with necessary lists and labels."""
     print("🔧 Setting up Trello Board")
@@ -29,14 +44,16 @@ def setup_trello_board():
         print("❌ Trello credentials not found!")
         return False
     
+    # Import the Trello SDK only once credentials are known to be present
+    from trello import TrelloClient
+
     try:
         # Initialize Trello client
         client = TrelloClient(api_key=trello_api_key, token=trello_token)
         
         # Extract board ID if it's a URL
-        if trello_board_id.startswith('http'):
-            import re
-            match = re.search(r'/b/([a-zA-Z0-9]+)', trello_board_id)
+        if trello_board_id.startswith(('http://', 'https://')):
+            match = _BOARD_ID_RE.search(trello_board_id)
             if match:
                 trello_board_id = match.group(1)
         
@@ -55,21 +72,32 @@ def setup_trello_board():
             "Summary"
         ]
         
-        # Create lists
+        # Create lists. Fetch the board's lists once up front; the dict
+        # gives O(1) membership checks and is reused for the test card below.
         print("\n📋 Creating lists...")
         created_lists = []
-        existing_lists = [lst.name for lst in board.list_lists()]
-        
+        existing_lists = {lst.name: lst for lst in board.list_lists()}
+
+        missing_lists = []
         for list_name in lists_to_create:
-            if list_name not in existing_lists:
-                try:
-                    new_list = board.add_list(list_name)
+            if list_name in existing_lists:
+                print(f"ℹ️  List already exists: {list_name}")
+            else:
+                missing_lists.append(list_name)
+
+        # POST the missing lists concurrently instead of one at a time
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(
+                lambda name: (name, _try_create(board.add_list, name)),
+                missing_lists
+            )
+            for list_name, result in results:
+                if isinstance(result, Exception):
+                    print(f"❌ Failed to create list '{list_name}': {result}")
+                else:
+                    existing_lists[list_name] = result
                     created_lists.append(list_name)
                     print(f"✅ Created list: {list_name}")
-                except Exception as e:
-                    print(f"❌ Failed to create list '{list_name}': {e}")
-            else:
-                print(f"ℹ️  List already exists: {list_name}")
         
         # Define labels to create
         labels_to_create = [
@@ -85,27 +113,36 @@ def setup_trello_board():
             ("mcp", "black")
         ]
         
-        # Create labels
+        # Create labels, with the same fetch-once pattern as lists
         print("\n🏷️  Creating labels...")
         created_labels = []
-        existing_labels = [label.name for label in board.get_labels()]
-        
+        existing_labels = {label.name: label for label in board.get_labels()}
+
+        missing_labels = []
         for label_name, color in labels_to_create:
-            if label_name not in existing_labels:
-                try:
-                    new_label = board.add_label(label_name, color)
+            if label_name in existing_labels:
+                print(f"ℹ️  Label already exists: {label_name}")
+            else:
+                missing_labels.append((label_name, color))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(
+                lambda item: (item, _try_create(board.add_label, item[0], item[1])),
+                missing_labels
+            )
+            for (label_name, color), result in results:
+                if isinstance(result, Exception):
+                    print(f"❌ Failed to create label '{label_name}': {result}")
+                else:
+                    existing_labels[label_name] = result
                     created_labels.append(label_name)
                     print(f"✅ Created label: {label_name} ({color})")
-                except Exception as e:
-                    print(f"❌ Failed to create label '{label_name}': {e}")
-            else:
-                print(f"ℹ️  Label already exists: {label_name}")
         
         # Create a test card
         print("\n📝 Creating test card...")
         try:
-            # Get the first list (or create one if none exist)
-            lists = board.list_lists()
+            # Reuse the cached lists instead of refetching the board
+            lists = list(existing_lists.values())
             if lists:
                 test_list = lists[0]
                 test_card = test_list.add_card(
@@ -113,8 +150,8 @@ def setup_trello_board():
                     desc="Your Trello board has been set up for the MCP GitHub Repository Analyzer.\n\nThis card was created automatically during setup."
                 )
                 
-                # Add some labels
-                labels = board.get_labels()
+                # Add some labels from the cached label map
+                labels = list(existing_labels.values())
                 if labels:
                     test_card.add_labels([labels[0].id])
                 
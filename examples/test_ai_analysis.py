@@ -7,17 +7,20 @@ This script demonstrates how to use the AI-powered code analyzer.
 
 import os
 import sys
+from itertools import islice
 from dotenv import load_dotenv
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from analyzers.github_analyzer import GitHubAnalyzer
-from analyzers.ai_analyzer import AIAnalyzer
-
 def test_ai_analysis():
     """Test the AI analysis functionality."""
-    
+    # Imported here so importing this module doesn't pull in the whole
+    # analyzer stack (github, openai, anthropic) for callers that only
+    # run one of the tests.
+    from analyzers.github_analyzer import GitHubAnalyzer
+    from analyzers.ai_analyzer import AIAnalyzer
+
     # Load environment variables
     load_dotenv()
     
@@ -58,9 +61,14 @@ def test_ai_analysis():
     try:
         contents = repo.get_contents("")
         sample_files = []
-        
-        for content in contents[:5]:  # Limit to 5 files for testing
-            if hasattr(content, 'content'):  # It's a file, not a directory
+
+        # islice stops consuming after 5 entries instead of slicing a
+        # fully materialized listing
+        for content in islice(contents, 5):  # Limit to 5 files for testing
+            # type is populated by the listing response; hasattr(content,
+            # 'content') would lazily GET each file body just to learn it
+            # isn't a directory.
+            if content.type == 'file':
                 sample_files.append({
                     'path': content.path,
                     'language': content.name.split('.')[-1] if '.' in content.name else 'unknown'
@@ -118,7 +126,9 @@ def test_ai_analysis():
 
 def test_specific_file_analysis():
     """Test AI analysis on a specific file."""
-    
+    from analyzers.github_analyzer import GitHubAnalyzer
+    from analyzers.ai_analyzer import AIAnalyzer
+
     load_dotenv()
     
     github_token = os.getenv("GITHUB_TOKEN")
@@ -77,22 +77,19 @@ Examples:
     )
     
     args = parser.parse_args()
-    
-    if args.command == 'server':
-        print("🚀 Starting MCP server...")
-        run_mcp_server()
-    elif args.command == 'workflow':
-        print(f"🚀 Running full MCP workflow for {args.repo_name}...")
-        run_workflow(args.repo_name)
-    elif args.command == 'test':
-        print("🧪 Running quick test...")
-        run_test()
-    elif args.command == 'setup-trello':
-        print("🔧 Setting up Trello board...")
-        setup_trello()
-    elif args.command == 'ai-test':
-        print("🤖 Testing AI analysis...")
-        test_ai()
+
+    # O(1) dispatch table: banner, handler, handler args
+    dispatch = {
+        'server': ("🚀 Starting MCP server...", run_mcp_server, ()),
+        'workflow': (f"🚀 Running full MCP workflow for {args.repo_name}...",
+                     run_workflow, (args.repo_name,)),
+        'test': ("🧪 Running quick test...", run_test, ()),
+        'setup-trello': ("🔧 Setting up Trello board...", setup_trello, ()),
+        'ai-test': ("🤖 Testing AI analysis...", test_ai, ()),
+    }
+    banner, handler, handler_args = dispatch[args.command]
+    print(banner)
+    handler(*handler_args)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
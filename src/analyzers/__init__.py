@@ -6,5 +6,6 @@ Contains modules for analyzing GitHub repositories and code quality.
 
 from .github_analyzer import GitHubAnalyzer
 from .ai_analyzer import AIAnalyzer, AIAnalysisResult
+from .code_analyzer import CodeAnalyzer
 
-__all__ = ['GitHubAnalyzer', 'AIAnalyzer', 'AIAnalysisResult'] 
\ No newline at end of file
+__all__ = ['GitHubAnalyzer', 'AIAnalyzer', 'AIAnalysisResult', 'CodeAnalyzer'] 
\ No newline at end of file
@@ -5,14 +5,263 @@ This module uses generative AI to analyze code quality, security, and provide in
 """
 
 import os
+import io
 import json
 import base64
+import functools
+import hashlib
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-import openai
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from openai import OpenAI, APIConnectionError, APITimeoutError, RateLimitError
 import anthropic
+import requests
 from github import Repository, GithubException
 
+try:
+    from ..utils.cache import DiskCache
+except ImportError:
+    # Script-style runs put src/ itself on sys.path
+    from utils.cache import DiskCache
+
+# Failures are logged through a queue so concurrent analysis workers
+# enqueue in O(1) instead of serializing on a blocking stderr write
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(_log_queue))
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
+# How long cached LLM analyses stay valid, in seconds
+_LLM_CACHE_TTL = 86400
+
+# Rough character budget for assembled code samples (~8k tokens at the
+# usual ~3 chars/token for source code), leaving headroom for the
+# instructions and the response
+_PROMPT_CHAR_BUDGET = 24000
+
+# Most recently fetched code slices kept per analyzer instance
+_CODE_CACHE_MAX = 256
+
+
+def _bounded_decode(encoded: str, max_chars: int) -> str:
+    """Decode only the base64 prefix needed to yield max_chars characters.
+
+    Decoding a whole multi-megabyte blob just to keep the first 2000
+    characters wastes memory proportional to file size; four base64
+    characters per (worst-case) UTF-8 byte bounds the work instead.
+    """
+    encoded = encoded.replace('\n', '')
+    bytes_needed = max_chars * 4  # worst-case UTF-8 width per character
+    b64_chars = (bytes_needed + 2) // 3 * 4  # 4 base64 chars per 3 bytes
+    raw = base64.b64decode(encoded[:b64_chars])
+    return raw.decode('utf-8', errors='ignore')[:max_chars]
+
+
+def _extract_json(s: str) -> Optional[str]:
+    """Return the first top-level JSON object in s, or None.
+
+    One balanced-brace walk that tracks string-literal state, so braces
+    inside the model's prose or string values can't mis-slice the way
+    find('{')/rfind('}') could, and the scan stops at the closing brace
+    instead of reading the whole response twice.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(s):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            if depth:
+                in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    if start != -1:
+        # Unclosed object -- hand it to the truncation repair pass
+        return s[start:]
+    return None
+
+
+def _repair_truncated_json(s: str) -> str:
+    """Close unterminated strings and brackets in truncated JSON.
+
+    When max_tokens cuts a response mid-object, the bulk of the analysis
+    is usually intact; appending the missing closers salvages it instead
+    of discarding everything for the fallback.
+    """
+    closers = []
+    in_string = False
+    escaped = False
+    for ch in s:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            closers.append('}')
+        elif ch == '[':
+            closers.append(']')
+        elif ch in '}]' and closers:
+            closers.pop()
+
+    repaired = s
+    if in_string:
+        repaired += '"'
+    tail = repaired.rstrip()
+    if tail.endswith(','):
+        tail = tail[:-1]
+    elif tail.endswith(':'):
+        # A key was cut off from its value; null keeps the object valid
+        tail += ' null'
+    return tail + ''.join(reversed(closers))
+
+
+def _stream_complete(buf: str) -> bool:
+    """True once buf holds one fully closed, parseable JSON object."""
+    candidate = _extract_json(buf)
+    if candidate is None or not candidate.endswith('}'):
+        return False
+    try:
+        json.loads(candidate)
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
+def _llm_cache_key(model: str, prompt: str) -> str:
+    """Build a stable cache key from the model and the exact prompt."""
+    digest = hashlib.sha256(f"{model}\x00{prompt}".encode()).hexdigest()
+    return f"llm:{digest}"
+
+# Transient failures worth retrying before falling back to the other
+# provider or the placeholder analysis
+_TRANSIENT_LLM_ERRORS = (
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    anthropic.RateLimitError,
+    anthropic.APITimeoutError,
+    anthropic.APIConnectionError,
+)
+
+_LLM_MAX_ATTEMPTS = 3
+
+
+def _with_llm_retry(fn):
+    """Retry transient LLM API failures with capped exponential backoff."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(_LLM_MAX_ATTEMPTS):
+            try:
+                return fn(*args, **kwargs)
+            except _TRANSIENT_LLM_ERRORS:
+                if attempt == _LLM_MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(2 ** attempt)
+    return wrapper
+
+
+# Shared item shapes for the schemas below
+_ISSUE_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "type": {"type": "string"},
+        "severity": {"type": "string"},
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "file": {"type": "string"},
+        "line": {"type": "string"},
+        "suggestion": {"type": "string"},
+    },
+    "required": ["type", "severity", "title", "description",
+                 "file", "line", "suggestion"],
+    "additionalProperties": False,
+}
+
+_SUGGESTION_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "type": {"type": "string"},
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "priority": {"type": "string"},
+        "impact": {"type": "string"},
+    },
+    "required": ["type", "title", "description",
+                 "priority", "impact"],
+    "additionalProperties": False,
+}
+
+# JSON Schema mirroring AIAnalysisResult, enforced server-side through
+# OpenAI structured outputs so the response is guaranteed parseable
+_ANALYSIS_SCHEMA = {
+    "name": "analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "issues": {"type": "array", "items": _ISSUE_ITEM_SCHEMA},
+            "suggestions": {"type": "array", "items": _SUGGESTION_ITEM_SCHEMA},
+            "scores": {
+                "type": "object",
+                "properties": {
+                    "code_quality": {"type": "integer"},
+                    "security": {"type": "integer"},
+                    "maintainability": {"type": "integer"},
+                },
+                "required": ["code_quality", "security", "maintainability"],
+                "additionalProperties": False,
+            },
+            "detailed_analysis": {"type": "string"},
+        },
+        "required": ["issues", "suggestions", "scores", "detailed_analysis"],
+        "additionalProperties": False,
+    },
+}
+
+# Single-file analyses ask the model for an overall score and summary
+# rather than per-dimension scores; the enforced schema has to match
+# that prompt or structured outputs silently coerce the reply
+_FILE_ANALYSIS_SCHEMA = {
+    "name": "file_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "issues": {"type": "array", "items": _ISSUE_ITEM_SCHEMA},
+            "suggestions": {"type": "array", "items": _SUGGESTION_ITEM_SCHEMA},
+            "overall_score": {"type": "integer"},
+            "summary": {"type": "string"},
+        },
+        "required": ["issues", "suggestions", "overall_score", "summary"],
+        "additionalProperties": False,
+    },
+}
+
 
 @dataclass
 class AIAnalysisResult:
@@ -28,19 +277,46 @@ class AIAnalysisResult:
 class AIAnalyzer:
     """AI-powered code analyzer using OpenAI and Anthropic."""
     
-    def __init__(self, openai_api_key: Optional[str] = None, anthropic_api_key: Optional[str] = None):
-        """Initialize AI analyzer with API keys."""
+    def __init__(self, openai_api_key: Optional[str] = None, anthropic_api_key: Optional[str] = None,
+                 race_providers: bool = False,
+                 openai_model: str = "gpt-4o-mini",
+                 openai_deep_model: str = "gpt-4o",
+                 anthropic_model: str = "claude-3-5-haiku-latest"):
+        """Initialize AI analyzer with API keys.
+
+        With race_providers=True (and both providers configured) the
+        analysis is sent to both at once and the first success wins,
+        trading double token spend for lower tail latency.
+
+        OpenAI analyses run on the cheap openai_model first; borderline
+        verdicts (low quality score or a critical issue) are confirmed
+        on openai_deep_model before being returned.
+        """
         self.openai_client = None
         self.anthropic_client = None
+        self.race_providers = race_providers
+        self.openai_model = openai_model
+        self.openai_deep_model = openai_deep_model
+        self.anthropic_model = anthropic_model
         
         # Initialize OpenAI
         if openai_api_key:
-            openai.api_key = openai_api_key
-            self.openai_client = openai.OpenAI(api_key=openai_api_key)
+            self.openai_client = OpenAI(api_key=openai_api_key)
         
         # Initialize Anthropic
         if anthropic_api_key:
             self.anthropic_client = anthropic.Anthropic(api_key=anthropic_api_key)
+
+        # With temperature 0 the analyses are deterministic per prompt,
+        # so identical requests can be answered from disk instead of
+        # spending tokens again.
+        self._llm_cache = DiskCache()
+        # Assembled prompts, keyed by (repo_name, sample paths), so the
+        # provider fallback and retries reuse the same text
+        self._prompt_cache: Dict[tuple, str] = {}
+        # LRU of fetched code slices, keyed by (repo, path, budget), so
+        # iterative reviews of the same paths skip the GitHub round-trip
+        self._code_cache: OrderedDict = OrderedDict()
     
     def analyze_repository_with_ai(self, repo: Repository, sample_files: List[Dict[str, Any]]) -> AIAnalysisResult:
         """Analyze repository using AI for intelligent code analysis."""
@@ -53,55 +329,142 @@ class AIAnalyzer:
         
         return analysis
     
+    def _fetch_code(self, repo: Repository, path: str, max_chars: int) -> Optional[tuple]:
+        """Fetch the first max_chars of a file as (code, size), memoized.
+
+        Repeated looks at the same path (common in iterative reviews)
+        return the cached slice instead of repeating the round-trip.
+        """
+        key = (repo.full_name, path, max_chars)
+        cached = self._code_cache.get(key)
+        if cached is not None:
+            self._code_cache.move_to_end(key)
+            return cached
+
+        try:
+            content = repo.get_contents(path)
+            if isinstance(content, list):
+                return None  # directory
+            if content.content:
+                # Limit code size: decode only the needed prefix
+                code = _bounded_decode(content.content, max_chars)
+            elif content.download_url:
+                # The contents API omits inline bodies for large files;
+                # a ranged raw download fetches just the prefix instead
+                # of the whole blob
+                resp = requests.get(
+                    content.download_url,
+                    headers={"Range": f"bytes=0-{max_chars * 4 - 1}"},
+                    timeout=30,
+                )
+                if resp.status_code not in (200, 206):
+                    return None
+                code = resp.content.decode('utf-8', errors='ignore')[:max_chars]
+            else:
+                return None
+        except (GithubException, requests.RequestException):
+            return None
+
+        result = (code, content.size)
+        self._code_cache[key] = result
+        if len(self._code_cache) > _CODE_CACHE_MAX:
+            self._code_cache.popitem(last=False)
+        return result
+
     def _prepare_code_samples(self, repo: Repository, sample_files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prepare code samples for AI analysis."""
-        samples = []
-        
-        for file_info in sample_files[:10]:  # Limit to 10 files for cost efficiency
-            try:
-                content = repo.get_contents(file_info['path'])
-                if hasattr(content, 'content'):
-                    code = base64.b64decode(content.content).decode('utf-8')
-                    samples.append({
-                        'path': file_info['path'],
-                        'language': file_info.get('language', 'unknown'),
-                        'code': code[:2000],  # Limit code size
-                        'size': len(code)
-                    })
-            except GithubException:
-                continue
-        
-        return samples
+
+        def fetch_sample(file_info):
+            fetched = self._fetch_code(repo, file_info['path'], 2000)
+            if fetched is None:
+                return None
+            code, size = fetched
+            return {
+                'path': file_info['path'],
+                'language': file_info.get('language', 'unknown'),
+                'code': code,
+                'size': size
+            }
+
+        # Fetch the file bodies concurrently; each is an independent GET
+        # and the order of sample_files is preserved by map().
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Limit to 10 files for cost efficiency
+            results = executor.map(fetch_sample, sample_files[:10])
+
+        return [sample for sample in results if sample]
     
     def _perform_ai_analysis(self, code_samples: List[Dict[str, Any]], repo_name: str) -> AIAnalysisResult:
         """Perform AI analysis on code samples."""
         
         # Create analysis prompt
         prompt = self._create_analysis_prompt(code_samples, repo_name)
-        
+
+        # Optionally race both providers and take the first success
+        if self.race_providers and self.openai_client and self.anthropic_client:
+            result = self._race_providers(prompt)
+            if result:
+                return result
+            return self._fallback_analysis(code_samples)
+
         # Try OpenAI first, then Anthropic as fallback
         if self.openai_client:
             try:
                 return self._analyze_with_openai(prompt)
-            except Exception as e:
-                print(f"OpenAI analysis failed: {e}")
-        
+            except Exception:
+                logger.exception("OpenAI analysis failed")
+
         if self.anthropic_client:
             try:
                 return self._analyze_with_anthropic(prompt)
-            except Exception as e:
-                print(f"Anthropic analysis failed: {e}")
+            except Exception:
+                logger.exception("Anthropic analysis failed")
         
         # Fallback to basic analysis
         return self._fallback_analysis(code_samples)
-    
+
+    def _race_providers(self, prompt: str) -> Optional[AIAnalysisResult]:
+        """Send the prompt to both providers and return the first success."""
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = [
+            executor.submit(self._analyze_with_openai, prompt),
+            executor.submit(self._analyze_with_anthropic, prompt),
+        ]
+        try:
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except Exception:
+                    logger.exception("Provider failed during race")
+            return None
+        finally:
+            # Don't block on the slower provider; its in-flight request
+            # can't be cancelled, only abandoned.
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _create_analysis_prompt(self, code_samples: List[Dict[str, Any]], repo_name: str) -> str:
         """Create a comprehensive analysis prompt for AI."""
-        
-        code_text = ""
+        cache_key = (repo_name, tuple(sample['path'] for sample in code_samples))
+        cached = self._prompt_cache.get(cache_key)
+        if cached:
+            return cached
+
+        # Assemble via join instead of repeated concatenation, and stop
+        # adding samples once the context budget is spent
+        parts = []
+        included_paths = []
+        total = 0
         for sample in code_samples:
-            code_text += f"\n--- File: {sample['path']} ({sample['language']}) ---\n"
-            code_text += sample['code'][:1000] + "\n"
+            block = (f"\n--- File: {sample['path']} ({sample['language']}) ---\n"
+                     f"{sample['code'][:1000]}\n")
+            if total + len(block) > _PROMPT_CHAR_BUDGET:
+                break
+            parts.append(block)
+            included_paths.append(sample['path'])
+            total += len(block)
+        code_text = ''.join(parts)
+
+        file_list = ", ".join(included_paths)
         
         prompt = f"""
 You are an expert software engineer and code reviewer. Analyze the following code samples from repository "{repo_name}" and provide a comprehensive analysis.
@@ -149,52 +512,86 @@ Focus on:
 7. Modern language features and improvements
 
 Be specific and actionable in your recommendations.
+
+Respond with the JSON object only -- no surrounding prose or markdown fences.
+Attribute every issue to one of the analyzed files by setting its "file"
+field to the exact path from this list: {file_list}.
 """
-        
+
+        self._prompt_cache[cache_key] = prompt
         return prompt
     
-    def _analyze_with_openai(self, prompt: str) -> AIAnalysisResult:
-        """Analyze code using OpenAI GPT-4."""
-        
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are an expert code reviewer and software engineer."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=4000
-        )
-        
-        content = response.choices[0].message.content
-        
-        # Try to parse JSON response
-        try:
-            # Extract JSON from response (in case there's extra text)
-            json_start = content.find('{')
-            json_end = content.rfind('}') + 1
-            json_str = content[json_start:json_end]
-            
-            analysis_data = json.loads(json_str)
-            
-            return AIAnalysisResult(
-                issues=analysis_data.get('issues', []),
-                suggestions=analysis_data.get('suggestions', []),
-                code_quality_score=analysis_data.get('scores', {}).get('code_quality', 70),
-                security_score=analysis_data.get('scores', {}).get('security', 70),
-                maintainability_score=analysis_data.get('scores', {}).get('maintainability', 70),
-                detailed_analysis=analysis_data.get('detailed_analysis', 'AI analysis completed.')
+    def _needs_deep_pass(self, result: AIAnalysisResult) -> bool:
+        """Whether a fast-model verdict warrants deep-model confirmation."""
+        if result.code_quality_score < 60:
+            return True
+        return any(issue.get('severity') == 'critical' for issue in result.issues)
+
+    @_with_llm_retry
+    def _analyze_with_openai(self, prompt: str, model: Optional[str] = None,
+                             response_schema: Dict[str, Any] = _ANALYSIS_SCHEMA) -> AIAnalysisResult:
+        """Analyze code using OpenAI, escalating borderline verdicts."""
+        model = model or self.openai_model
+        cache_key = _llm_cache_key(model, prompt)
+        cached = self._llm_cache.get(cache_key, max_age=_LLM_CACHE_TTL)
+        if cached:
+            result = AIAnalysisResult(**cached)
+        else:
+            # Stream the completion so the request can be cut off as soon
+            # as a fully closed JSON object has arrived, instead of paying
+            # (in tokens and wall clock) for anything the model appends
+            # after it
+            stream = self.openai_client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": "You are an expert code reviewer and software engineer."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0,
+                max_tokens=4000,
+                response_format={"type": "json_schema", "json_schema": response_schema},
+                stream=True
             )
-            
-        except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
-            return self._fallback_analysis([])
+            parts = []
+            try:
+                for i, chunk in enumerate(stream):
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        parts.append(delta)
+                    # Re-scanning the buffer per chunk would be quadratic;
+                    # every 32nd chunk keeps the check cheap while still
+                    # aborting well before max_tokens
+                    if i % 32 == 31 and _stream_complete(''.join(parts)):
+                        break
+            finally:
+                stream.close()
+            content = ''.join(parts)
+
+            result = self._parse_analysis_content(content)
+            if result is None:
+                # Fallback if JSON parsing fails
+                return self._fallback_analysis([])
+            # Only successful parses are cached; fallbacks are not
+            self._llm_cache.set(cache_key, asdict(result))
+
+        # A low score or a critical finding from the fast model is worth
+        # the extra spend of a confirmation pass on the deep model
+        if model == self.openai_model and model != self.openai_deep_model \
+                and self._needs_deep_pass(result):
+            return self._analyze_with_openai(prompt, model=self.openai_deep_model,
+                                             response_schema=response_schema)
+        return result
     
+    @_with_llm_retry
     def _analyze_with_anthropic(self, prompt: str) -> AIAnalysisResult:
         """Analyze code using Anthropic Claude."""
-        
+        cache_key = _llm_cache_key(self.anthropic_model, prompt)
+        cached = self._llm_cache.get(cache_key, max_age=_LLM_CACHE_TTL)
+        if cached:
+            return AIAnalysisResult(**cached)
+
         response = self.anthropic_client.messages.create(
-            model="claude-3-sonnet-20240229",
+            model=self.anthropic_model,
             max_tokens=4000,
             messages=[
                 {"role": "user", "content": prompt}
@@ -202,28 +599,112 @@ Be specific and actionable in your recommendations.
         )
         
         content = response.content[0].text
-        
-        # Try to parse JSON response
+
+        result = self._parse_analysis_content(content)
+        if result is None:
+            return self._fallback_analysis([])
+        self._llm_cache.set(cache_key, asdict(result))
+        return result
+    
+    def _parse_analysis_content(self, content: str) -> Optional[AIAnalysisResult]:
+        """Parse a model response into an AIAnalysisResult, or None."""
+        # Extract JSON from response (in case there's extra text)
+        json_str = _extract_json(content)
+        if json_str is None:
+            return None
         try:
-            # Extract JSON from response
-            json_start = content.find('{')
-            json_end = content.rfind('}') + 1
-            json_str = content[json_start:json_end]
-            
             analysis_data = json.loads(json_str)
-            
-            return AIAnalysisResult(
-                issues=analysis_data.get('issues', []),
-                suggestions=analysis_data.get('suggestions', []),
-                code_quality_score=analysis_data.get('scores', {}).get('code_quality', 70),
-                security_score=analysis_data.get('scores', {}).get('security', 70),
-                maintainability_score=analysis_data.get('scores', {}).get('maintainability', 70),
-                detailed_analysis=analysis_data.get('detailed_analysis', 'AI analysis completed.')
-            )
-            
         except json.JSONDecodeError:
-            return self._fallback_analysis([])
-    
+            # Salvage responses truncated by the max_tokens cap
+            try:
+                analysis_data = json.loads(_repair_truncated_json(json_str))
+            except json.JSONDecodeError:
+                return None
+
+        return AIAnalysisResult(
+            issues=analysis_data.get('issues', []),
+            suggestions=analysis_data.get('suggestions', []),
+            code_quality_score=analysis_data.get('scores', {}).get('code_quality', 70),
+            security_score=analysis_data.get('scores', {}).get('security', 70),
+            maintainability_score=analysis_data.get('scores', {}).get('maintainability', 70),
+            detailed_analysis=analysis_data.get('detailed_analysis', 'AI analysis completed.')
+        )
+
+    def analyze_repositories_batch(self, repo_samples: Dict[str, List[Dict[str, Any]]],
+                                   poll_interval: float = 60,
+                                   timeout: float = 86400) -> Dict[str, AIAnalysisResult]:
+        """Analyze many repositories through the OpenAI Batch API.
+
+        Batched completions cost half the per-token price and draw on a
+        separate rate-limit pool, at the cost of up to 24h turnaround --
+        suited to non-interactive bulk scans, not the live workflow.
+
+        repo_samples maps a repository name to its prepared code samples
+        (as returned by _prepare_code_samples). Returns a dict of
+        repository name to AIAnalysisResult for every request that
+        completed; missing keys mean that entry failed.
+        """
+        if not self.openai_client or not repo_samples:
+            return {}
+
+        lines = []
+        for repo_name, code_samples in repo_samples.items():
+            prompt = self._create_analysis_prompt(code_samples, repo_name)
+            lines.append(json.dumps({
+                "custom_id": repo_name,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.openai_model,
+                    "messages": [
+                        {"role": "system", "content": "You are an expert code reviewer and software engineer."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0,
+                    "max_tokens": 4000,
+                    "response_format": {"type": "json_schema", "json_schema": _ANALYSIS_SCHEMA},
+                },
+            }))
+
+        try:
+            batch_file = self.openai_client.files.create(
+                file=io.BytesIO("\n".join(lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = self.openai_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            deadline = time.time() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.time() > deadline:
+                    return {}
+                time.sleep(poll_interval)
+                batch = self.openai_client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                return {}
+            output = self.openai_client.files.content(batch.output_file_id).text
+        except Exception:
+            logger.exception("Batch analysis failed")
+            return {}
+
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            parsed = self._parse_analysis_content(content)
+            if parsed:
+                results[record.get("custom_id")] = parsed
+        return results
+
     def _fallback_analysis(self, code_samples: List[Dict[str, Any]]) -> AIAnalysisResult:
         """Fallback analysis when AI is not available."""
         
@@ -257,16 +738,15 @@ Be specific and actionable in your recommendations.
     def analyze_specific_file(self, repo: Repository, file_path: str) -> Dict[str, Any]:
         """Analyze a specific file with AI."""
         
-        try:
-            content = repo.get_contents(file_path)
-            if hasattr(content, 'content'):
-                code = base64.b64decode(content.content).decode('utf-8')
-                
-                prompt = f"""
+        fetched = self._fetch_code(repo, file_path, 3000)
+        if fetched:
+            code, _ = fetched
+
+            prompt = f"""
 Analyze this specific file: {file_path}
 
 Code:
-{code[:3000]}
+{code}
 
 Provide a detailed analysis focusing on:
 1. Code quality and readability
@@ -283,13 +763,10 @@ Format your response as JSON:
     "summary": "Brief summary"
 }}
 """
-                
-                if self.openai_client:
-                    return self._analyze_with_openai(prompt)
-                elif self.anthropic_client:
-                    return self._analyze_with_anthropic(prompt)
-                    
-        except GithubException:
-            pass
-        
-        return {"error": "Could not analyze file"} 
\ No newline at end of file
+
+            if self.openai_client:
+                return self._analyze_with_openai(prompt, response_schema=_FILE_ANALYSIS_SCHEMA)
+            elif self.anthropic_client:
+                return self._analyze_with_anthropic(prompt)
+
+        return {"error": "Could not analyze file"}
\ No newline at end of file
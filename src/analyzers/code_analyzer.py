@@ -0,0 +1,297 @@
+"""
+Code Analyzer
+
+This module performs pattern-based static analysis of repository files to
+detect security, code quality, and performance issues.
+"""
+
+import re
+import sys
+import base64
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
+from github import Repository
+from github.GithubException import GithubException
+
+# File extensions worth analyzing. A tuple so str.endswith can test all of
+# them in a single C call.
+ANALYZABLE_EXTENSIONS = (
+    '.py', '.js', '.jsx', '.ts', '.tsx', '.java',
+    '.cpp', '.c', '.h', '.cs', '.go', '.rs', '.php'
+)
+
+
+# Raw patterns per category; each category is fused into a single compiled
+# alternation so the per-line loop does one search per category.
+ISSUE_PATTERNS = {
+    "security": [
+        r"password\s*=\s*['\"][^'\"]+['\"]",
+        r"api_key\s*=\s*['\"][^'\"]+['\"]",
+        r"secret\s*=\s*['\"][^'\"]+['\"]",
+        r"eval\s*\(",
+        r"exec\s*\(",
+        r"os\.system\s*\(",
+        r"subprocess\.call\s*\(",
+    ],
+    "code_quality": [
+        r"print\s*\(",
+        r"console\.log\s*\(",
+    ],
+    "performance": [
+        r"while\s+True:",
+        r"import\s+\*",
+        r"\.append\s*\(.*\)\s*#.*loop",
+    ],
+}
+
+
+# Guards against pathological inputs: blobs above MAX_FILE_SIZE bytes are
+# never fetched, and lines longer than MAX_LINE_LENGTH (minified bundles,
+# embedded data) are skipped rather than fed to the regex engine.
+MAX_FILE_SIZE = 200_000
+MAX_LINE_LENGTH = 500
+
+# Code quality markers that are plain fixed strings. These are matched with
+# `in` (one C-level memchr scan) instead of going through the regex engine.
+QUALITY_MARKERS = ("todo:", "fixme:", "xxx:", "hack:", "debugger;")
+
+# Interned single copies of the strings repeated in every issue record, so
+# thousands of issue dicts share the same objects instead of duplicating them
+SEV_LOW = sys.intern("low")
+SEV_MEDIUM = sys.intern("medium")
+SEV_HIGH = sys.intern("high")
+TYPE_SECURITY = sys.intern("security")
+TYPE_QUALITY = sys.intern("code_quality")
+TYPE_PERFORMANCE = sys.intern("performance")
+
+# Severity for each quality marker; regex-only matches default to "low"
+MARKER_SEVERITY = {
+    "todo:": SEV_LOW,
+    "fixme:": SEV_LOW,
+    "xxx:": SEV_MEDIUM,
+    "hack:": SEV_MEDIUM,
+    "debugger;": SEV_LOW,
+}
+
+# Literal anchors extracted from the patterns above. A line that contains
+# none of these substrings cannot match any pattern, so the regex engines
+# are never invoked for it. Most source lines are filtered out here.
+LITERAL_ANCHORS = (
+    "password", "api_key", "secret", "eval", "exec",
+    "os.system", "subprocess.call",
+    "todo:", "fixme:", "xxx:", "hack:",
+    "print", "debugger;", "console.log",
+    "while", "import", ".append",
+)
+
+# The same anchors as bytes, applied to the raw blob before it is decoded.
+# A file whose bytes contain none of them cannot produce any issue, so the
+# UTF-8 decode and the whole line scan are skipped for it.
+BYTES_ANCHORS = tuple(anchor.encode('ascii') for anchor in LITERAL_ANCHORS)
+
+
+def _fuse_patterns(patterns: List[str]) -> "re.Pattern":
+    """Combine a list of patterns into one alternation with named groups."""
+    return re.compile(
+        "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(patterns)),
+        re.IGNORECASE
+    )
+
+
+class CodeAnalyzer:
+    """Static code analyzer that scans file contents for common issues."""
+
+    # Compiled once at class definition; every instance shares them
+    issue_patterns = ISSUE_PATTERNS
+    _security_re = _fuse_patterns(ISSUE_PATTERNS["security"])
+    _quality_re = _fuse_patterns(ISSUE_PATTERNS["code_quality"])
+    _performance_re = _fuse_patterns(ISSUE_PATTERNS["performance"])
+
+    def __init__(self):
+        """Initialize the code analyzer."""
+        # Per-file results keyed by blob sha; unchanged files are not
+        # refetched or rescanned on repeat analyses.
+        self._analysis_cache = {}
+
+    def is_analyzable_file(self, file_path: str) -> bool:
+        """Check whether a file should be analyzed based on its extension."""
+        return file_path.endswith(ANALYZABLE_EXTENSIONS)
+
+    def analyze_file_content(self, file_path: str, content: str) -> List[Dict[str, Any]]:
+        """Analyze the content of a single file for issues."""
+        # Binary content that slipped through the extension filter
+        if '\x00' in content:
+            return []
+
+        # Issues are accumulated column-wise (type, severity, title,
+        # description, line, code) and materialized into dicts once at the
+        # end, so the hot loop only appends to flat lists.
+        col_type = []
+        col_severity = []
+        col_title = []
+        col_description = []
+        col_line = []
+        col_code = []
+
+        def record(issue_type, severity, title, description, line_number, code):
+            col_type.append(issue_type)
+            col_severity.append(severity)
+            col_title.append(title)
+            col_description.append(description)
+            col_line.append(line_number)
+            col_code.append(code)
+
+        # Hoist method lookups out of the per-line loop
+        security_search = self._security_re.search
+        quality_search = self._quality_re.search
+        performance_search = self._performance_re.search
+
+        for line_number, line in enumerate(content.splitlines(), 1):
+            # Minified or generated content; not worth pattern matching
+            if len(line) > MAX_LINE_LENGTH:
+                continue
+
+            # Cheap literal prefilter: skip lines that cannot match anything
+            line_lower = line.lower()
+            if not any(anchor in line_lower for anchor in LITERAL_ANCHORS):
+                continue
+
+            # Comment lines can only carry quality markers (TODO: etc.);
+            # the security and performance regexes are skipped for them.
+            is_comment = line.lstrip().startswith(('#', '//', '*', '/*'))
+
+            # Check security patterns
+            if not is_comment and security_search(line):
+                record(TYPE_SECURITY, SEV_HIGH, "Potential security issue",
+                       "Line matches a known security risk pattern.",
+                       line_number, line.strip())
+
+            # Check code quality markers (fixed strings) and patterns
+            marker = next((m for m in QUALITY_MARKERS if m in line_lower), None)
+            if marker is not None or (not is_comment and quality_search(line)):
+                record(TYPE_QUALITY, MARKER_SEVERITY.get(marker, SEV_LOW),
+                       "Code quality issue",
+                       "Line contains a code quality marker or debug statement.",
+                       line_number, line.strip())
+
+            # Check performance patterns
+            if not is_comment and performance_search(line):
+                record(TYPE_PERFORMANCE, SEV_MEDIUM, "Potential performance issue",
+                       "Line matches a known performance anti-pattern.",
+                       line_number, line.strip())
+
+        # Materialize the columns into the issue dicts callers expect
+        return [
+            {
+                "type": issue_type,
+                "severity": severity,
+                "title": title,
+                "description": description,
+                "file": file_path,
+                "line": line_number,
+                "code": code
+            }
+            for issue_type, severity, title, description, line_number, code
+            in zip(col_type, col_severity, col_title, col_description,
+                   col_line, col_code)
+        ]
+
+    def collect_files(self, repo: Repository) -> List[Any]:
+        """Collect analyzable files with a single recursive tree listing.
+
+        Uses the Git Trees API (one request for the whole repository)
+        instead of walking directories with one get_contents call each.
+        """
+        try:
+            tree = repo.get_git_tree(repo.default_branch, recursive=True)
+            return [
+                element for element in tree.tree
+                if element.type == "blob"
+                and self.is_analyzable_file(element.path)
+                and (element.size or 0) <= MAX_FILE_SIZE
+            ]
+        except GithubException:
+            return []
+
+    def analyze_repository_files(self, repo: Repository, max_files: int = 50) -> Dict[str, Any]:
+        """Analyze files in the repository and aggregate issues found."""
+        analysis = {
+            "issues": [],
+            "suggestions": [],
+            "analyzed_files": 0,
+            "total_files_found": 0
+        }
+
+        files = self.collect_files(repo)
+        analysis["total_files_found"] = len(files)
+
+        def fetch_file(element):
+            """Fetch and decode one blob; returns (path, code) or None.
+
+            Files whose raw bytes contain no literal anchor are returned
+            with code None: they count as analyzed but are never decoded.
+            """
+            try:
+                blob = repo.get_git_blob(element.sha)
+                raw = base64.b64decode(blob.content)
+                raw_lower = raw.lower()
+                if not any(anchor in raw_lower for anchor in BYTES_ANCHORS):
+                    return element.path, None
+                return element.path, raw.decode('utf-8')
+            except (GithubException, UnicodeDecodeError):
+                return None
+
+        # Serve unchanged blobs from cache; only fetch the rest
+        to_fetch = []
+        for element in files[:max_files]:
+            cached = self._analysis_cache.get(element.sha)
+            if cached is not None:
+                analysis["issues"].extend(cached)
+                analysis["analyzed_files"] += 1
+            else:
+                to_fetch.append(element)
+
+        # Fetch file contents concurrently (network-bound), then analyze
+        # serially -- the pattern matching itself is cheap by comparison.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            fetched = executor.map(fetch_file, to_fetch)
+
+            for element, result in zip(to_fetch, fetched):
+                if result is None:
+                    continue
+                path, code = result
+                file_issues = [] if code is None else self.analyze_file_content(path, code)
+                self._analysis_cache[element.sha] = file_issues
+                analysis["issues"].extend(file_issues)
+                analysis["analyzed_files"] += 1
+
+        # Suggest cleanups when many low-severity issues pile up
+        low_issues = [i for i in analysis["issues"] if i.get("severity") == "low"]
+        if len(low_issues) > 10:
+            analysis["suggestions"].append({
+                "type": "cleanup",
+                "title": "Clean Up Code Markers",
+                "description": f"Found {len(low_issues)} low-severity issues (TODOs, prints). Consider a cleanup pass."
+            })
+
+        return analysis
+
+    def get_analysis_summary(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize analysis results by severity and type."""
+        issues = analysis.get("issues", [])
+        severity_counter = Counter(issue.get("severity", "low") for issue in issues)
+        type_counts = dict(Counter(issue.get("type", "unknown") for issue in issues))
+
+        severity_counts = {
+            severity: severity_counter[severity]
+            for severity in ("critical", "high", "medium", "low")
+        }
+
+        return {
+            "total_issues": len(issues),
+            "severity_counts": severity_counts,
+            "type_counts": type_counts,
+            "analyzed_files": analysis.get("analyzed_files", 0),
+            "total_files_found": analysis.get("total_files_found", 0)
+        }
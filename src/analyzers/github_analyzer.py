@@ -4,12 +4,169 @@ GitHub Repository Analyzer
 This module handles GitHub API interactions and repository analysis.
 """
 
+import functools
 import os
 import re
+import threading
+import time
+from concurrent.futures import Future
+from itertools import islice
 from typing import Dict, List, Optional, Any
 from github import Github, Repository, ContentFile
 from github.GithubException import GithubException
 import base64
+import requests
+
+try:
+    from ..utils.cache import DiskCache
+except ImportError:
+    # Script-style runs put src/ itself on sys.path
+    from utils.cache import DiskCache
+
+# GraphQL endpoint and query used to gather everything the workflow needs
+# (repo info, top-level tree, recent issues, recent commits) in one request.
+GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
+
+CONTENTS_ENDPOINT = "https://api.github.com/repos/{full_name}/contents/{path}"
+
+# How long memoized repository metadata stays fresh, in seconds
+MEMO_TTL = 300
+
+# Accepts https://github.com/owner/repo(.git), github.com/owner/repo, or
+# plain owner/repo, compiled once instead of splitting per call. Trailing
+# path segments (/tree/main, /issues, ...) are ignored like the old
+# split-based parsing did.
+_REPO_RE = re.compile(r"(?:https?://)?(?:www\.)?(?:github\.com/)?([\w.-]+)/([\w.-]+?)(?:\.git)?(?:/.*)?$")
+
+# Filename classifier for structure analysis: exact names resolve with a
+# single dict lookup; the prefix pairs cover README.* / LICENSE.* variants.
+_NAME_FLAGS = {
+    "dockerfile": "has_dockerfile",
+    ".github": "has_github_actions",
+    "requirements.txt": "has_requirements",
+    "pyproject.toml": "has_requirements",
+    "setup.py": "has_requirements",
+    "package.json": "has_requirements",
+    "tests": "has_tests",
+    "test": "has_tests",
+    "spec": "has_tests",
+    "__tests__": "has_tests",
+}
+_PREFIX_FLAGS = (("readme", "has_readme"), ("license", "has_license"))
+
+# Retry policy for transient GitHub failures
+_MAX_ATTEMPTS = 5
+_MAX_SLEEP = 60
+
+# When the remaining REST quota falls below this floor, decorated calls
+# pause briefly so concurrent bursts don't trip the secondary limiter
+_RATE_FLOOR = 50
+_RATE_FLOOR_DELAY = 1.0
+
+
+def with_github_retry(fn):
+    """Retry a GitHub call on rate limits and transient server errors.
+
+    Sleeps the amount prescribed by retry-after / x-ratelimit-reset when
+    present, otherwise backs off exponentially. Other errors, and the
+    final failed attempt, propagate to the caller. Near-exhausted quota
+    adds a small pre-emptive delay before each call.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Read the requester's raw counters, which are tracked from the
+        # last response's headers; the Github.rate_limiting property
+        # issues a blocking get_rate_limit() call when they are still
+        # unknown (-1, -1), and a pre-check must never add a request
+        client = getattr(args[0], "github", None) if args else None
+        requester = getattr(client, "_Github__requester", None)
+        if requester is not None and 0 <= requester.rate_limiting[0] < _RATE_FLOOR:
+            time.sleep(_RATE_FLOOR_DELAY)
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return fn(*args, **kwargs)
+            except GithubException as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                headers = e.headers or {}
+                if e.status == 403 and 'retry-after' in headers:
+                    delay = float(headers['retry-after'])
+                elif e.status == 403 and headers.get('x-ratelimit-remaining') == '0':
+                    delay = float(headers.get('x-ratelimit-reset', 0)) - time.time()
+                elif e.status >= 500:
+                    delay = 2 ** attempt
+                else:
+                    raise
+                time.sleep(min(max(delay, 0), _MAX_SLEEP))
+    return wrapper
+
+
+def _classify_name(name: str) -> Optional[str]:
+    """Map a lowercased root entry name to its structure flag, if any."""
+    flag = _NAME_FLAGS.get(name)
+    if flag:
+        return flag
+    for prefix, prefix_flag in _PREFIX_FLAGS:
+        if name.startswith(prefix):
+            return prefix_flag
+    return None
+
+WORKFLOW_BUNDLE_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    description
+    primaryLanguage { name }
+    stargazerCount
+    forkCount
+    createdAt
+    updatedAt
+    url
+    sshUrl
+    diskUsage
+    hasWikiEnabled
+    hasIssuesEnabled
+    hasProjectsEnabled
+    licenseInfo { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    defaultBranchRef {
+      name
+      target {
+        ... on Commit {
+          history(first: 10) {
+            nodes {
+              oid
+              message
+              committedDate
+              url
+              author { name }
+            }
+          }
+        }
+      }
+    }
+    issues(first: 10, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+      totalCount
+      nodes {
+        number
+        title
+        body
+        state
+        createdAt
+        updatedAt
+        author { login }
+        labels(first: 10) { nodes { name } }
+      }
+    }
+    object(expression: "HEAD:") {
+      ... on Tree {
+        entries { name type }
+      }
+    }
+  }
+}
+"""
 
 
 class GitHubAnalyzer:
@@ -17,32 +174,97 @@ class GitHubAnalyzer:
         """Initialize GitHub analyzer with API token."""
         self.github = Github(token)
         self.token = token
+        # Shared session for the direct REST/GraphQL calls: connection
+        # keep-alive avoids a TCP+TLS handshake per request
+        self._session = requests.Session()
+        # ETag cache for file contents: (full_name, path) -> (etag, text).
+        # Conditional GETs that come back 304 reuse the cached body and
+        # don't count against the rate limit. Entries are mirrored to
+        # disk so later runs revalidate instead of refetching.
+        self._content_cache: Dict[tuple, tuple] = {}
+        self._disk = DiskCache()
+        # TTL memos for repository metadata, keyed by repo URL or full
+        # name, each storing (fetched_at, value)
+        self._repo_cache: Dict[str, tuple] = {}
+        self._info_cache: Dict[str, tuple] = {}
+        self._struct_cache: Dict[str, tuple] = {}
+        self._listing_cache: Dict[str, tuple] = {}
+        # In-flight repository lookups, so concurrent callers asking for
+        # the same repo share one request instead of issuing duplicates
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _memo_get(self, cache: Dict[str, tuple], key: str) -> Optional[Any]:
+        """Return a memoized value if it is younger than MEMO_TTL."""
+        entry = cache.get(key)
+        if entry and time.time() - entry[0] < MEMO_TTL:
+            return entry[1]
+        return None
+
+    def refresh(self) -> None:
+        """Drop all memoized metadata so the next calls hit the API."""
+        self._repo_cache.clear()
+        self._info_cache.clear()
+        self._struct_cache.clear()
+        self._listing_cache.clear()
 
     def get_repository(self, repo_url: str) -> Optional[Repository]:
         """Extract repository from URL and return GitHub repository object."""
+        cached = self._memo_get(self._repo_cache, repo_url)
+        if cached:
+            return cached
+
+        # Coalesce concurrent lookups: the first caller for a URL does
+        # the fetch, later ones block on its future.
+        with self._inflight_lock:
+            future = self._inflight.get(repo_url)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[repo_url] = future
+        if not is_owner:
+            return future.result()
+
         try:
-            # Extract owner/repo from various URL formats
-            if 'github.com' in repo_url:
-                # Handle URLs like https://github.com/owner/repo
-                parts = repo_url.split('github.com/')[-1].split('/')
-                if len(parts) >= 2:
-                    owner, repo_name = parts[0], parts[1]
-                    return self.github.get_repo(f"{owner}/{repo_name}")
-            else:
-                # Assume it's already in owner/repo format
-                return self.github.get_repo(repo_url)
+            repo = self._fetch_repository(repo_url)
+            if repo:
+                self._repo_cache[repo_url] = (time.time(), repo)
+            future.set_result(repo)
+            return repo
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(repo_url, None)
+
+    @with_github_retry
+    def _get_repo(self, full_name: str) -> Repository:
+        """Fetch a repository handle, retrying transient failures."""
+        return self.github.get_repo(full_name)
+
+    def _fetch_repository(self, repo_url: str) -> Optional[Repository]:
+        """Resolve a repository URL or full name against the API."""
+        match = _REPO_RE.match(repo_url)
+        if not match:
+            return None
+        try:
+            return self._get_repo(f"{match[1]}/{match[2]}")
         except GithubException as e:
             print(f"Error accessing repository: {e}")
             return None
-        return None
 
     def get_repository_info(self, repo_url: str) -> Dict[str, Any]:
         """Get comprehensive repository information."""
+        cached = self._memo_get(self._info_cache, repo_url)
+        if cached:
+            return cached
+
         repo = self.get_repository(repo_url)
         if not repo:
             return {"error": "Could not access repository"}
 
-        return {
+        info = {
             "name": repo.name,
             "full_name": repo.full_name,
             "description": repo.description,
@@ -63,47 +285,221 @@ class GitHubAnalyzer:
             "has_projects": repo.has_projects,
             "has_downloads": repo.has_downloads,
         }
+        self._info_cache[repo_url] = (time.time(), info)
+        return info
+
+    def fetch_workflow_bundle(self, repo_url: str) -> Optional[Dict[str, Any]]:
+        """Fetch repository info, structure, issues, and commits in one call.
+
+        Issues a single GraphQL query instead of six REST round-trips and
+        returns a dict with "repo_info", "structure", "recent_issues", and
+        "recent_commits" keys shaped like the corresponding REST methods.
+        Returns None when the query fails so callers can fall back to REST.
+        """
+        # Extract owner/name from URL or owner/repo format
+        match = _REPO_RE.match(repo_url)
+        if not match:
+            return None
+        owner, name = match[1], match[2]
+
+        try:
+            response = self._session.post(
+                GRAPHQL_ENDPOINT,
+                json={
+                    "query": WORKFLOW_BUNDLE_QUERY,
+                    "variables": {"owner": owner, "name": name}
+                },
+                headers={"Authorization": f"bearer {self.token}"},
+                timeout=30,
+            )
+            response.raise_for_status()
+            repo_data = response.json()["data"]["repository"]
+        except (requests.RequestException, KeyError, TypeError, ValueError):
+            return None
+
+        if not repo_data:
+            return None
+
+        default_branch = repo_data.get("defaultBranchRef") or {}
+        language = repo_data.get("primaryLanguage") or {}
+        license_info = repo_data.get("licenseInfo") or {}
+        topics = repo_data.get("repositoryTopics", {}).get("nodes", [])
+
+        repo_info = {
+            "name": repo_data["name"],
+            "full_name": repo_data["nameWithOwner"],
+            "description": repo_data.get("description"),
+            "language": language.get("name"),
+            "stars": repo_data.get("stargazerCount", 0),
+            "forks": repo_data.get("forkCount", 0),
+            "open_issues": repo_data.get("issues", {}).get("totalCount", 0),
+            "created_at": repo_data.get("createdAt"),
+            "updated_at": repo_data.get("updatedAt"),
+            "url": repo_data.get("url"),
+            "clone_url": f"{repo_data.get('url')}.git" if repo_data.get("url") else None,
+            "default_branch": default_branch.get("name"),
+            "topics": [node["topic"]["name"] for node in topics],
+            "license": license_info.get("name"),
+            "size": repo_data.get("diskUsage", 0),
+            "has_wiki": repo_data.get("hasWikiEnabled", False),
+            "has_issues": repo_data.get("hasIssuesEnabled", False),
+            "has_projects": repo_data.get("hasProjectsEnabled", False),
+        }
+
+        structure = {
+            "has_readme": False,
+            "has_license": False,
+            "has_requirements": False,
+            "has_dockerfile": False,
+            "has_github_actions": False,
+            "has_tests": False,
+            "files": [],
+            "directories": []
+        }
+        tree = repo_data.get("object") or {}
+        for entry in tree.get("entries", []):
+            flag = _classify_name(entry["name"].lower())
+            if flag:
+                structure[flag] = True
+
+            if entry["type"] == "tree":
+                structure["directories"].append(entry["name"])
+            else:
+                structure["files"].append(entry["name"])
+
+        recent_issues = [
+            {
+                "number": issue["number"],
+                "title": issue["title"],
+                "body": issue.get("body"),
+                "state": issue["state"].lower(),
+                "labels": [label["name"] for label in issue.get("labels", {}).get("nodes", [])],
+                "created_at": issue.get("createdAt"),
+                "updated_at": issue.get("updatedAt"),
+                "user": (issue.get("author") or {}).get("login", "unknown"),
+            }
+            for issue in repo_data.get("issues", {}).get("nodes", [])
+        ]
+
+        history = ((default_branch.get("target") or {}).get("history") or {}).get("nodes", [])
+        recent_commits = [
+            {
+                "sha": commit["oid"],
+                "message": commit["message"],
+                "author": (commit.get("author") or {}).get("name", "unknown"),
+                "date": commit.get("committedDate"),
+                "url": commit.get("url"),
+            }
+            for commit in history
+        ]
+
+        return {
+            "repo_info": repo_info,
+            "structure": structure,
+            "recent_issues": recent_issues,
+            "recent_commits": recent_commits,
+        }
+
+    def iter_repositories(self, username: str):
+        """Yield repository dicts for a user/organization as pages arrive.
+
+        PyGithub's paginated list fetches lazily, so consumers that stop
+        early (e.g. islice) only pull the pages they actually read.
+        """
+        user = self.github.get_user(username)
+        for repo in user.get_repos():
+            yield {
+                "name": repo.name,
+                "full_name": repo.full_name,
+                "description": repo.description,
+                "language": repo.language,
+                "stars": repo.stargazers_count,
+                "forks": repo.forks_count,
+                "url": repo.html_url,
+                "private": repo.private,
+                "updated_at": repo.updated_at.isoformat(),
+            }
 
     def list_repositories(self, username: str) -> List[Dict[str, Any]]:
         """List repositories for a given user/organization."""
+        cached = self._memo_get(self._listing_cache, username)
+        if cached:
+            return cached
         try:
-            user = self.github.get_user(username)
-            repos = []
-            for repo in user.get_repos():
-                repos.append({
-                    "name": repo.name,
-                    "full_name": repo.full_name,
-                    "description": repo.description,
-                    "language": repo.language,
-                    "stars": repo.stargazers_count,
-                    "forks": repo.forks_count,
-                    "url": repo.html_url,
-                    "private": repo.private,
-                    "updated_at": repo.updated_at.isoformat(),
-                })
-            return repos
+            repos = list(self.iter_repositories(username))
         except GithubException as e:
             return [{"error": f"Could not fetch repositories: {e}"}]
+        self._listing_cache[username] = (time.time(), repos)
+        return repos
 
     def get_file_content(self, repo: Repository, path: str) -> Optional[str]:
-        """Get content of a specific file from the repository."""
+        """Get content of a specific file from the repository.
+
+        Sends a conditional GET with the last known ETag; a 304 response
+        returns the cached body without spending a rate-limit token.
+        """
+        key = (repo.full_name, path)
+        disk_key = f"content:{repo.full_name}:{path}"
+        entry = self._content_cache.get(key)
+        if entry is None:
+            # ETag entries never expire on their own -- the conditional
+            # GET is what decides whether the body is still current
+            stored = self._disk.get(disk_key, max_age=float("inf"))
+            if stored:
+                entry = (stored[0], stored[1])
+        etag, cached_text = entry or (None, None)
+
+        headers = {
+            "Authorization": f"token {self.token}",
+            "Accept": "application/vnd.github.v3+json",
+        }
+        if etag:
+            headers["If-None-Match"] = etag
+
         try:
-            content = repo.get_contents(path)
-            # Handle both single file and list of files
-            if isinstance(content, list):
-                # If it's a list, return None (directory)
-                return None
-            elif hasattr(content, 'content'):
-                # Decode content from base64
-                return base64.b64decode(content.content).decode('utf-8')
+            response = self._session.get(
+                CONTENTS_ENDPOINT.format(full_name=repo.full_name, path=path),
+                headers=headers,
+                timeout=30,
+            )
+        except requests.RequestException:
             return None
-        except GithubException:
+
+        if response.status_code == 304:
+            self._content_cache[key] = (etag, cached_text)
+            return cached_text
+        if response.status_code != 200:
+            return None
+
+        data = response.json()
+        # A list means the path is a directory
+        if isinstance(data, list) or not data.get("content"):
             return None
 
+        try:
+            text = base64.b64decode(data["content"]).decode('utf-8')
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+        new_etag = response.headers.get("ETag")
+        if new_etag:
+            self._content_cache[key] = (new_etag, text)
+            self._disk.set(disk_key, [new_etag, text])
+        return text
+
+    @with_github_retry
+    def _get_root_contents(self, repo: Repository):
+        """List the repository root, retrying transient failures."""
+        return repo.get_contents("")
+
     def analyze_repository_structure(self, repo: Repository) -> Dict[str, Any]:
         """Analyze the repository structure and identify key files."""
+        cached = self._memo_get(self._struct_cache, repo.full_name)
+        if cached:
+            return cached
+
         try:
-            contents = repo.get_contents("")
+            contents = self._get_root_contents(repo)
             structure = {
                 "has_readme": False,
                 "has_license": False,
@@ -116,75 +512,92 @@ class GitHubAnalyzer:
             }
 
             for content in contents:
-                name = content.name.lower()
-                if name == "readme.md" or name.startswith("readme"):
-                    structure["has_readme"] = True
-                elif name == "license" or name.startswith("license"):
-                    structure["has_license"] = True
-                elif name in ["requirements.txt", "pyproject.toml", "setup.py", "package.json"]:
-                    structure["has_requirements"] = True
-                elif name == "dockerfile":
-                    structure["has_dockerfile"] = True
-                elif name == ".github":
-                    structure["has_github_actions"] = True
-                elif name in ["tests", "test", "spec", "__tests__"]:
-                    structure["has_tests"] = True
+                flag = _classify_name(content.name.lower())
+                if flag:
+                    structure[flag] = True
 
                 if content.type == "dir":
                     structure["directories"].append(content.name)
                 else:
                     structure["files"].append(content.name)
 
+            self._struct_cache[repo.full_name] = (time.time(), structure)
             return structure
         except GithubException as e:
             return {"error": f"Could not analyze repository structure: {e}"}
 
+    def iter_issues(self, repo: Repository, state: str = 'open'):
+        """Yield issue dicts lazily; only consumed pages are fetched."""
+        for issue in repo.get_issues(state=state):
+            yield {
+                "number": issue.number,
+                "title": issue.title,
+                "body": issue.body,
+                "state": issue.state,
+                "labels": [label.name for label in issue.labels],
+                "created_at": issue.created_at.isoformat(),
+                "updated_at": issue.updated_at.isoformat(),
+                "user": issue.user.login,
+            }
+
+    def iter_commits(self, repo: Repository):
+        """Yield commit dicts lazily; only consumed pages are fetched."""
+        for commit in repo.get_commits():
+            yield {
+                "sha": commit.sha,
+                "message": commit.commit.message,
+                "author": commit.commit.author.name,
+                "date": commit.commit.author.date.isoformat(),
+                "url": commit.html_url,
+            }
+
+    @with_github_retry
+    def _collect_recent_issues(self, repo: Repository, limit: int) -> List[Dict[str, Any]]:
+        return list(islice(self.iter_issues(repo), limit))
+
+    @with_github_retry
+    def _collect_recent_commits(self, repo: Repository, limit: int) -> List[Dict[str, Any]]:
+        return list(islice(self.iter_commits(repo), limit))
+
     def get_recent_issues(self, repo: Repository, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent issues from the repository."""
         try:
-            issues = []
-            for issue in repo.get_issues(state='open')[:limit]:
-                issues.append({
-                    "number": issue.number,
-                    "title": issue.title,
-                    "body": issue.body,
-                    "state": issue.state,
-                    "labels": [label.name for label in issue.labels],
-                    "created_at": issue.created_at.isoformat(),
-                    "updated_at": issue.updated_at.isoformat(),
-                    "user": issue.user.login,
-                })
-            return issues
+            return self._collect_recent_issues(repo, limit)
         except GithubException:
             return []
 
     def get_recent_commits(self, repo: Repository, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent commits from the repository."""
         try:
-            commits = []
-            for commit in repo.get_commits()[:limit]:
-                commits.append({
-                    "sha": commit.sha,
-                    "message": commit.commit.message,
-                    "author": commit.commit.author.name,
-                    "date": commit.commit.author.date.isoformat(),
-                    "url": commit.html_url,
-                })
-            return commits
+            return self._collect_recent_commits(repo, limit)
         except GithubException:
             return []
 
-    def analyze_code_quality(self, repo: Repository) -> Dict[str, Any]:
-        """Analyze code quality by examining key files."""
+    def analyze_code_quality(self, repo: Repository,
+                             structure: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze code quality by examining key files.
+
+        Callers that already hold a structure dict (e.g. from the GraphQL
+        workflow bundle) can pass it in to skip the REST listing entirely.
+        """
         analysis = {
             "issues": [],
             "suggestions": [],
             "score": 100  # Start with perfect score
         }
 
+        # One root listing answers every existence question below; only
+        # content inspection (which this method doesn't do) would justify
+        # per-file fetches. This also fixes the old directory-as-file
+        # probes like get_file_content(repo, "tests/"), which always
+        # returned None.
+        if structure is None:
+            structure = self.analyze_repository_structure(repo)
+        if "error" in structure:
+            structure = {}
+
         # Check for README
-        readme_content = self.get_file_content(repo, "README.md")
-        if not readme_content:
+        if not structure.get("has_readme"):
             analysis["issues"].append({
                 "type": "documentation",
                 "severity": "medium",
@@ -194,9 +607,7 @@ class GitHubAnalyzer:
             analysis["score"] -= 10
 
         # Check for license
-        license_files = ["LICENSE", "LICENSE.md", "LICENSE.txt"]
-        has_license = any(self.get_file_content(repo, f) for f in license_files)
-        if not has_license:
+        if not structure.get("has_license"):
             analysis["issues"].append({
                 "type": "legal",
                 "severity": "medium",
@@ -206,9 +617,7 @@ class GitHubAnalyzer:
             analysis["score"] -= 5
 
         # Check for requirements/dependencies
-        req_files = ["requirements.txt", "pyproject.toml", "setup.py", "package.json"]
-        has_requirements = any(self.get_file_content(repo, f) for f in req_files)
-        if not has_requirements:
+        if not structure.get("has_requirements"):
             analysis["issues"].append({
                 "type": "setup",
                 "severity": "high",
@@ -218,9 +627,7 @@ class GitHubAnalyzer:
             analysis["score"] -= 15
 
         # Check for tests
-        test_dirs = ["tests", "test", "spec", "__tests__"]
-        has_tests = any(self.get_file_content(repo, f"{d}/") for d in test_dirs)
-        if not has_tests:
+        if not structure.get("has_tests"):
             analysis["issues"].append({
                 "type": "testing",
                 "severity": "medium",
@@ -230,7 +637,7 @@ class GitHubAnalyzer:
             analysis["score"] -= 10
 
         # Check for CI/CD
-        if not self.get_file_content(repo, ".github/workflows/"):
+        if not structure.get("has_github_actions"):
             analysis["suggestions"].append({
                 "type": "ci_cd",
                 "title": "Consider Adding CI/CD",
@@ -4,17 +4,134 @@ Trello Task Manager
 This module handles Trello API interactions for creating and managing tasks.
 """
 
+import functools
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from trello import TrelloClient
 from trello.exceptions import ResourceUnavailable
 
+try:
+    from ..utils.cache import DiskCache
+except ImportError:
+    # Script-style runs put src/ itself on sys.path
+    from utils.cache import DiskCache
+
+# How long persisted board metadata stays fresh, in seconds
+_BOARD_CACHE_TTL = 300
+
+# Severity -> target list routing for analysis cards
+_SEVERITY_LISTS = {"high": "High Priority", "critical": "Critical"}
+
+# Score -> summary label color, precomputed for every score 0..100
+_SCORE_COLOR = tuple(
+    "red" if s < 60 else "yellow" if s < 80 else "green" for s in range(101)
+)
+
+# Board id extractor for URLs like https://trello.com/b/Diz3GQos/name,
+# compiled once at import
+_BOARD_ID_RE = re.compile(r'/b/([a-zA-Z0-9]+)')
+
+# Card-description templates, written without leading/trailing
+# whitespace so the per-card work is one format_map instead of a
+# triple-quoted f-string build plus a .strip() copy
+_ISSUE_CARD_TPL = (
+    "**GitHub Issue #{number}**\n"
+    "\n"
+    "{body}\n"
+    "\n"
+    "**Created by:** {user}\n"
+    "**Created:** {created_at}\n"
+    "**Labels:** {labels}\n"
+    "\n"
+    "[View on GitHub](https://github.com/{repo_name}/issues/{number})"
+)
+
+_ANALYSIS_ISSUE_TPL = (
+    "**Code Analysis Issue**\n"
+    "\n"
+    "**Type:** {type}\n"
+    "**Severity:** {severity}\n"
+    "\n"
+    "{description}\n"
+    "\n"
+    "**Repository:** {repo_name}\n"
+    "**Analysis Score:** {score}/100"
+)
+
+_SUGGESTION_CARD_TPL = (
+    "**Code Analysis Suggestion**\n"
+    "\n"
+    "**Type:** {type}\n"
+    "\n"
+    "{description}\n"
+    "\n"
+    "**Repository:** {repo_name}\n"
+    "**Analysis Score:** {score}/100"
+)
+
+_SUMMARY_CARD_TPL = (
+    "**Repository Analysis Summary**\n"
+    "\n"
+    "**Repository:** {full_name}\n"
+    "**Language:** {language}\n"
+    "**Stars:** {stars}\n"
+    "**Forks:** {forks}\n"
+    "**Open Issues:** {open_issues}\n"
+    "\n"
+    "**Analysis Results:**\n"
+    "- **Quality Score:** {score}/100\n"
+    "- **Issues Found:** {n_issues}\n"
+    "- **Suggestions:** {n_suggestions}\n"
+    "- **Trello Cards Created:** {total_cards}\n"
+    "\n"
+    "**Repository URL:** {url}"
+)
+
 
 class TrelloManager:
+    # Fixed attribute slots skip the per-instance __dict__ and make
+    # attribute access slightly cheaper in the per-card hot paths
+    __slots__ = (
+        "client",
+        "board_id",
+        "board",
+        "_session",
+        "_disk",
+        "_lists_cache",
+        "_labels_cache",
+        "_label_index",
+        "_list_index",
+        "_list_objs",
+    )
+
     def __init__(self, api_key: str, token: str, board_id: str):
         """Initialize Trello manager with API credentials."""
-        self.client = TrelloClient(api_key=api_key, token=token)
+        # py-trello defaults to the module-level requests, paying a TCP+TLS
+        # handshake per call; a pooled Session amortizes it across the many
+        # small POSTs a bulk card creation issues.
+        self._session = requests.Session()
+        self._session.headers["Accept"] = "application/json"
+        # Pool sized for create_cards_bulk's 10 workers, with backoff on
+        # Trello's 429 rate-limit replies and transient gateway errors.
+        # allowed_methods=None retries POSTs too -- a 429 means the
+        # request was rejected, so replaying it is safe.
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=None,
+            ),
+        ))
+        self.client = TrelloClient(api_key=api_key, token=token,
+                                   http_service=self._session)
         self.board_id = self._extract_board_id(board_id)
         
         try:
@@ -23,29 +140,53 @@ class TrelloManager:
             print(f"Warning: Could not access Trello board: {e}")
             self.board = None
         
-        # Cache for lists and labels
+        # Cache for lists and labels, mirrored to disk so each fresh
+        # manager (one per test run) skips the board metadata refetch
+        self._disk = DiskCache()
         self._lists_cache = None
         self._labels_cache = None
+        # id -> trello.List object, so create_card doesn't refetch the
+        # same List from the API for every card it files into it
+        self._list_objs: Dict[str, Any] = {}
+        # name.lower() -> id, so per-card label resolution is one dict
+        # lookup instead of a linear scan over the board's labels
+        self._label_index: Dict[str, str] = {}
+        # Same shape for list names, keyed once in get_lists
+        self._list_index: Dict[str, str] = {}
 
-    def _extract_board_id(self, board_id: str) -> str:
-        """Extract board ID from various formats."""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _extract_board_id(board_id: str) -> str:
+        """Extract board ID from various formats.
+
+        Pure string parsing, so repeat constructions against the same
+        board URL (every test run) resolve from the lru_cache.
+        """
         # If it's a full URL, extract the ID
         if board_id.startswith('http'):
-            # Extract ID from URL like https://trello.com/b/Diz3GQos/mcp-practice
-            match = re.search(r'/b/([a-zA-Z0-9]+)', board_id)
+            match = _BOARD_ID_RE.search(board_id)
             if match:
                 return match.group(1)
-        
+
         # If it's already just the ID, return as is
         return board_id
 
     def get_lists(self) -> List[Dict[str, Any]]:
         """Get all lists from the board."""
         if self._lists_cache is None:
+            disk_key = f"trello:lists:{self.board_id}"
+            cached = self._disk.get(disk_key, max_age=_BOARD_CACHE_TTL)
+            if cached is not None:
+                self._lists_cache = cached
+                self._list_index = {
+                    lst["name"].lower(): lst["id"] for lst in cached
+                }
+                return self._lists_cache
             try:
                 if not self.board:
                     return []
                 lists = self.board.list_lists()
+                self._list_objs = {lst.id: lst for lst in lists}
                 self._lists_cache = [
                     {
                         "id": lst.id,
@@ -54,6 +195,11 @@ class TrelloManager:
                     }
                     for lst in lists
                 ]
+                self._list_index = {
+                    lst["name"].lower(): lst["id"]
+                    for lst in self._lists_cache
+                }
+                self._disk.set(disk_key, self._lists_cache)
             except ResourceUnavailable:
                 self._lists_cache = []
         return self._lists_cache
@@ -61,6 +207,14 @@ class TrelloManager:
     def get_labels(self) -> List[Dict[str, Any]]:
         """Get all labels from the board."""
         if self._labels_cache is None:
+            disk_key = f"trello:labels:{self.board_id}"
+            cached = self._disk.get(disk_key, max_age=_BOARD_CACHE_TTL)
+            if cached is not None:
+                self._labels_cache = cached
+                self._label_index = {
+                    label["name"].lower(): label["id"] for label in cached
+                }
+                return self._labels_cache
             try:
                 if not self.board:
                     return []
@@ -73,6 +227,11 @@ class TrelloManager:
                     }
                     for label in labels
                 ]
+                self._label_index = {
+                    label["name"].lower(): label["id"]
+                    for label in self._labels_cache
+                }
+                self._disk.set(disk_key, self._labels_cache)
             except ResourceUnavailable:
                 self._labels_cache = []
         return self._labels_cache
@@ -83,35 +242,36 @@ class TrelloManager:
             if not self.board:
                 return None
             label = self.board.add_label(name, color)
-            # Refresh labels cache
-            self._labels_cache = None
+            # Extend the caches in place; invalidating them would force
+            # a full board refetch on the next lookup
+            if self._labels_cache is not None:
+                self._labels_cache.append({
+                    "id": label.id,
+                    "name": label.name,
+                    "color": label.color
+                })
+            self._label_index[name.lower()] = label.id
+            if self._labels_cache is not None:
+                self._disk.set(f"trello:labels:{self.board_id}", self._labels_cache)
             return label.id
         except ResourceUnavailable:
             return None
 
     def get_or_create_label(self, name: str, color: str = "blue") -> Optional[str]:
         """Get existing label or create a new one."""
-        labels = self.get_labels()
-        
-        # Check if label already exists
-        for label in labels:
-            if label["name"].lower() == name.lower():
-                return label["id"]
-        
-        # Create new label
-        label_id = self.create_label(name, color)
+        self.get_labels()  # Warm the cache and index on first use
+
+        label_id = self._label_index.get(name.lower())
         if label_id:
-            # Refresh labels cache
-            self._labels_cache = None
-        return label_id
+            return label_id
+
+        # Create new label
+        return self.create_label(name, color)
 
     def get_list_by_name(self, list_name: str) -> Optional[str]:
         """Get list ID by name."""
-        lists = self.get_lists()
-        for lst in lists:
-            if lst["name"].lower() == list_name.lower():
-                return lst["id"]
-        return None
+        self.get_lists()  # Warm the cache and index on first use
+        return self._list_index.get(list_name.lower())
 
     def create_card(self, 
                    title: str, 
@@ -134,8 +294,12 @@ class TrelloManager:
                     return None
                 list_id = lists[0]["id"]
             
-            # Get list object
-            trello_list = self.client.get_list(list_id)
+            # Get list object (memoized; the disk-cached path has no
+            # objects yet, so misses fall back to one fetch per list)
+            trello_list = self._list_objs.get(list_id)
+            if trello_list is None:
+                trello_list = self.client.get_list(list_id)
+                self._list_objs[list_id] = trello_list
             
             # Create card
             card = trello_list.add_card(name=title, desc=description, due=due_date)
@@ -168,141 +332,140 @@ class TrelloManager:
             print(f"Error creating Trello card: {e}")
             return None
 
+    def create_cards_bulk(self, payloads: List[Dict[str, Any]],
+                          max_workers: int = 10) -> List[Dict[str, Any]]:
+        """Create multiple cards concurrently.
+
+        Payloads are dicts of create_card keyword arguments. List and label
+        lookups are warmed serially first so the worker threads only POST
+        cards and never race to create the same label.
+        """
+        if not payloads:
+            return []
+
+        self.get_lists()
+        seen_labels = set()
+        for payload in payloads:
+            for label_name in payload.get("labels") or []:
+                if label_name not in seen_labels:
+                    seen_labels.add(label_name)
+                    self.get_or_create_label(label_name)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda payload: self.create_card(**payload), payloads)
+
+        return [card for card in results if card]
+
     def create_issue_cards(self, issues: List[Dict[str, Any]], repo_name: str) -> List[Dict[str, Any]]:
         """Create Trello cards for GitHub issues."""
-        created_cards = []
-        
+        payloads = []
+
         for issue in issues:
+            # Lowercase the labels once per issue; the routing checks
+            # and description reuse them instead of re-deriving
+            raw_labels = issue.get("labels", [])
+            lower_labels = {label.lower() for label in raw_labels}
+
             # Determine list based on issue type
             list_name = "To Do"
-            if "bug" in [label.lower() for label in issue.get("labels", [])]:
+            if "bug" in lower_labels:
                 list_name = "Bugs"
-            elif "enhancement" in [label.lower() for label in issue.get("labels", [])]:
+            elif "enhancement" in lower_labels:
                 list_name = "Enhancements"
-            
+
             # Create labels (use just the repo name, not full path)
             repo_label = repo_name.split('/')[-1] if '/' in repo_name else repo_name
-            labels = [repo_label] + issue.get("labels", [])
+            labels = [repo_label] + raw_labels
             
             # Create description
-            description = f"""
-**GitHub Issue #{issue['number']}**
-
-{issue.get('body', 'No description provided')}
-
-**Created by:** {issue.get('user', 'Unknown')}
-**Created:** {issue.get('created_at', 'Unknown')}
-**Labels:** {', '.join(issue.get('labels', []))}
-
-[View on GitHub](https://github.com/{repo_name}/issues/{issue['number']})
-            """.strip()
-            
-            # Create card
-            card = self.create_card(
-                title=f"Issue #{issue['number']}: {issue['title']}",
-                description=description,
-                list_name=list_name,
-                labels=labels
-            )
+            description = _ISSUE_CARD_TPL.format_map({
+                "number": issue['number'],
+                "body": issue.get('body', 'No description provided'),
+                "user": issue.get('user', 'Unknown'),
+                "created_at": issue.get('created_at', 'Unknown'),
+                "labels": ', '.join(raw_labels),
+                "repo_name": repo_name,
+            })
             
-            if card:
-                created_cards.append(card)
-        
-        return created_cards
+            payloads.append({
+                "title": f"Issue #{issue['number']}: {issue['title']}",
+                "description": description,
+                "list_name": list_name,
+                "labels": labels
+            })
+
+        return self.create_cards_bulk(payloads)
 
     def create_analysis_cards(self, analysis: Dict[str, Any], repo_name: str) -> List[Dict[str, Any]]:
         """Create Trello cards for code analysis issues."""
-        created_cards = []
-        
-        # Create cards for issues
+        payloads = []
+
+        # The repo label and score are loop invariants; compute them once
+        # instead of per issue and per suggestion
+        repo_label = repo_name.split('/')[-1] if '/' in repo_name else repo_name
+        score = analysis.get('score', 'N/A')
+
+        # Collect cards for issues
         for issue in analysis.get("issues", []):
-            # Determine list based on severity
-            list_name = "To Do"
-            if issue.get("severity") == "high":
-                list_name = "High Priority"
-            elif issue.get("severity") == "critical":
-                list_name = "Critical"
-            
-            # Create labels (use just the repo name, not full path)
-            repo_label = repo_name.split('/')[-1] if '/' in repo_name else repo_name
+            # Route by severity with one table lookup
+            list_name = _SEVERITY_LISTS.get(issue.get("severity"), "To Do")
+
             labels = [repo_label, issue.get("type", "analysis"), issue.get("severity", "medium")]
             
             # Create description
-            description = f"""
-**Code Analysis Issue**
+            description = _ANALYSIS_ISSUE_TPL.format_map({
+                "type": issue.get('type', 'Unknown'),
+                "severity": issue.get('severity', 'Medium'),
+                "description": issue.get('description', 'No description provided'),
+                "repo_name": repo_name,
+                "score": score,
+            })
 
-**Type:** {issue.get('type', 'Unknown')}
-**Severity:** {issue.get('severity', 'Medium')}
-
-{issue.get('description', 'No description provided')}
+            payloads.append({
+                "title": issue.get("title", "Code Analysis Issue"),
+                "description": description,
+                "list_name": list_name,
+                "labels": labels
+            })
 
-**Repository:** {repo_name}
-**Analysis Score:** {analysis.get('score', 'N/A')}/100
-            """.strip()
-            
-            # Create card
-            card = self.create_card(
-                title=issue.get("title", "Code Analysis Issue"),
-                description=description,
-                list_name=list_name,
-                labels=labels
-            )
-            
-            if card:
-                created_cards.append(card)
-        
-        # Create cards for suggestions
+        # Collect cards for suggestions
         for suggestion in analysis.get("suggestions", []):
-            # Create labels (use just the repo name, not full path)
-            repo_label = repo_name.split('/')[-1] if '/' in repo_name else repo_name
             labels = [repo_label, "suggestion", suggestion.get("type", "improvement")]
-            
-            description = f"""
-**Code Analysis Suggestion**
-
-**Type:** {suggestion.get('type', 'Unknown')}
-
-{suggestion.get('description', 'No description provided')}
 
-**Repository:** {repo_name}
-**Analysis Score:** {analysis.get('score', 'N/A')}/100
-            """.strip()
+            description = _SUGGESTION_CARD_TPL.format_map({
+                "type": suggestion.get('type', 'Unknown'),
+                "description": suggestion.get('description', 'No description provided'),
+                "repo_name": repo_name,
+                "score": score,
+            })
             
-            card = self.create_card(
-                title=suggestion.get("title", "Code Analysis Suggestion"),
-                description=description,
-                list_name="Suggestions",
-                labels=labels
-            )
-            
-            if card:
-                created_cards.append(card)
-        
-        return created_cards
+            payloads.append({
+                "title": suggestion.get("title", "Code Analysis Suggestion"),
+                "description": description,
+                "list_name": "Suggestions",
+                "labels": labels
+            })
+
+        return self.create_cards_bulk(payloads)
 
     def create_summary_card(self, repo_info: Dict[str, Any], analysis: Dict[str, Any], 
                           total_cards_created: int) -> Optional[Dict[str, Any]]:
         """Create a summary card with repository analysis results."""
         score = analysis.get("score", 0)
-        score_color = "green" if score >= 80 else "yellow" if score >= 60 else "red"
+        score_color = _SCORE_COLOR[max(0, min(100, score))]
         
-        description = f"""
-**Repository Analysis Summary**
-
-**Repository:** {repo_info.get('full_name', 'Unknown')}
-**Language:** {repo_info.get('language', 'Unknown')}
-**Stars:** {repo_info.get('stars', 0)}
-**Forks:** {repo_info.get('forks', 0)}
-**Open Issues:** {repo_info.get('open_issues', 0)}
-
-**Analysis Results:**
-- **Quality Score:** {score}/100
-- **Issues Found:** {len(analysis.get('issues', []))}
-- **Suggestions:** {len(analysis.get('suggestions', []))}
-- **Trello Cards Created:** {total_cards_created}
-
-**Repository URL:** {repo_info.get('url', 'N/A')}
-        """.strip()
+        description = _SUMMARY_CARD_TPL.format_map({
+            "full_name": repo_info.get('full_name', 'Unknown'),
+            "language": repo_info.get('language', 'Unknown'),
+            "stars": repo_info.get('stars', 0),
+            "forks": repo_info.get('forks', 0),
+            "open_issues": repo_info.get('open_issues', 0),
+            "score": score,
+            "n_issues": len(analysis.get('issues', [])),
+            "n_suggestions": len(analysis.get('suggestions', [])),
+            "total_cards": total_cards_created,
+            "url": repo_info.get('url', 'N/A'),
+        })
         
         # Use repository name without slash for label
         repo_label = repo_info.get('name', 'repo')
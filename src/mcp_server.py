@@ -6,10 +6,11 @@ analyzing GitHub repositories and creating Trello tasks.
 """
 
 import asyncio
+import functools
 import json
 import os
+from itertools import islice
 from typing import Any, Dict, List, Optional
-from dotenv import load_dotenv
 
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -25,12 +26,10 @@ from mcp.types import (
     EmbeddedResource,
 )
 
-from .analyzers.github_analyzer import GitHubAnalyzer
-from .managers.trello_manager import TrelloManager
-from .analyzers.ai_analyzer import AIAnalyzer
+from .utils.env import load_env_once
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (no-op if a calling script already did)
+load_env_once()
 
 # Initialize components
 github_token = os.getenv("GITHUB_TOKEN")
@@ -38,28 +37,47 @@ trello_api_key = os.getenv("TRELLO_API_KEY")
 trello_token = os.getenv("TRELLO_TOKEN")
 trello_board_id = os.getenv("TRELLO_BOARD_ID")
 
-# Initialize analyzers and managers
-github_analyzer = None
-trello_manager = None
-ai_analyzer = AIAnalyzer(
-    openai_api_key=os.getenv("OPENAI_API_KEY"),
-    anthropic_api_key=os.getenv("ANTHROPIC_API_KEY")
-)
 
-if github_token:
-    github_analyzer = GitHubAnalyzer(github_token)
+# The analyzers pull in PyGithub, py-trello, openai, and anthropic --
+# hundreds of ms of import work a client that only lists repositories
+# never needs. Each factory imports and builds its component on first
+# use; lru_cache keeps the singleton semantics of the old globals.
+
+@functools.lru_cache(maxsize=1)
+def _get_github_analyzer():
+    """Build the GitHub analyzer on first use, or None without a token."""
+    if not github_token:
+        return None
+    from .analyzers.github_analyzer import GitHubAnalyzer
+    return GitHubAnalyzer(github_token)
+
 
-if trello_api_key and trello_token and trello_board_id:
-    trello_manager = TrelloManager(trello_api_key, trello_token, trello_board_id)
+@functools.lru_cache(maxsize=1)
+def _get_trello_manager():
+    """Build the Trello manager on first use, or None if unconfigured."""
+    if not (trello_api_key and trello_token and trello_board_id):
+        return None
+    from .managers.trello_manager import TrelloManager
+    return TrelloManager(trello_api_key, trello_token, trello_board_id)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ai_analyzer():
+    """Build the AI analyzer on first use."""
+    from .analyzers.ai_analyzer import AIAnalyzer
+    return AIAnalyzer(
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY")
+    )
 
 # Create MCP server
 server = Server("github-trello-analyzer")
 
 
-@server.list_tools()
-async def handle_list_tools() -> ListToolsResult:
-    """List available tools."""
-    tools = [
+# The tool schemas never change, so the reply is built once at import
+# instead of reallocating the Tool objects on every MCP handshake
+_LIST_TOOLS_RESULT = ListToolsResult(
+    tools=[
         Tool(
             name="analyze_repository",
             description="Analyze a GitHub repository, identify issues, and create Trello tasks",
@@ -141,35 +159,34 @@ async def handle_list_tools() -> ListToolsResult:
             }
         )
     ]
-    
-    return ListToolsResult(tools=tools)
+)
+
+
+@server.list_tools()
+async def handle_list_tools() -> ListToolsResult:
+    """List available tools."""
+    return _LIST_TOOLS_RESULT
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     """Handle tool calls."""
-    
-    if name == "analyze_repository":
-        return await analyze_repository(arguments)
-    elif name == "list_repositories":
-        return await list_repositories(arguments)
-    elif name == "get_repository_info":
-        return await get_repository_info(arguments)
-    elif name == "create_trello_card":
-        return await create_trello_card(arguments)
-    else:
-        return CallToolResult(
-            content=[
-                TextContent(
-                    type="text",
-                    text=f"Unknown tool: {name}"
-                )
-            ]
-        )
+    handler = _TOOL_DISPATCH.get(name)
+    if handler:
+        return await handler(arguments)
+    return CallToolResult(
+        content=[
+            TextContent(
+                type="text",
+                text=f"Unknown tool: {name}"
+            )
+        ]
+    )
 
 
 async def analyze_repository(arguments: Dict[str, Any]) -> CallToolResult:
     """Analyze a GitHub repository and optionally create Trello tasks."""
+    github_analyzer = _get_github_analyzer()
     if not github_analyzer:
         return CallToolResult(
             content=[
@@ -207,29 +224,41 @@ async def analyze_repository(arguments: Dict[str, Any]) -> CallToolResult:
                 ]
             )
         
-        # Get repository information
-        repo_info = github_analyzer.get_repository_info(repo_url)
-        
-        # Analyze repository structure
-        structure = github_analyzer.analyze_repository_structure(repo)
-        
-        # Analyze code quality
-        code_quality = github_analyzer.analyze_code_quality(repo)
-        
-        # Perform AI-powered code analysis
-        sample_files = []
-        contents = repo.get_contents("")
-        for content in contents[:max_files]:
-            if hasattr(content, 'content'):
-                sample_files.append({
-                    'path': content.path,
-                    'language': content.name.split('.')[-1] if '.' in content.name else 'unknown'
-                })
-        
-        ai_analysis = ai_analyzer.analyze_repository_with_ai(repo, sample_files)
-        
-        # Get recent issues
-        recent_issues = github_analyzer.get_recent_issues(repo, limit=10)
+        # One GraphQL round-trip covers the repo info, root structure,
+        # and recent issues (~1 rate-limit point instead of 4+); the
+        # gathered REST calls stay as the fallback when GraphQL is
+        # unavailable. PyGithub is synchronous, so everything runs in
+        # worker threads off the event loop.
+        bundle = await asyncio.to_thread(github_analyzer.fetch_workflow_bundle, repo_url)
+        if bundle:
+            repo_info = bundle["repo_info"]
+            structure = bundle["structure"]
+            recent_issues = bundle["recent_issues"]
+        else:
+            repo_info, structure, recent_issues = await asyncio.gather(
+                asyncio.to_thread(github_analyzer.get_repository_info, repo_url),
+                asyncio.to_thread(github_analyzer.analyze_repository_structure, repo),
+                asyncio.to_thread(github_analyzer.get_recent_issues, repo, 10),
+            )
+
+        # Code quality reads the structure fetched above instead of
+        # re-listing the repository root
+        code_quality = github_analyzer.analyze_code_quality(repo, structure)
+
+        # The structure already names the root files, so the AI sample
+        # list needs no separate contents call; islice stops after
+        # max_files entries.
+        sample_files = [
+            {
+                'path': name,
+                'language': name.split('.')[-1] if '.' in name else 'unknown'
+            }
+            for name in islice(structure.get('files', []), max_files)
+        ]
+
+        ai_analysis = await asyncio.to_thread(
+            _get_ai_analyzer().analyze_repository_with_ai, repo, sample_files
+        )
         
         # Combine all analysis results
         combined_analysis = {
@@ -240,16 +269,24 @@ async def analyze_repository(arguments: Dict[str, Any]) -> CallToolResult:
         
         # Create Trello tasks if requested
         trello_results = {}
+        trello_manager = _get_trello_manager()
         if create_trello_tasks and trello_manager:
-            # Create cards for analysis issues
-            analysis_cards = trello_manager.create_analysis_cards(combined_analysis, repo_info["full_name"])
-            
-            # Create cards for GitHub issues
-            issue_cards = trello_manager.create_issue_cards(recent_issues, repo_info["full_name"])
-            
-            # Create summary card
+            # The analysis and issue batches are independent; each one
+            # already fans out its POSTs through create_cards_bulk's
+            # thread pool, so running both off-thread overlaps them and
+            # keeps the event loop free.
+            analysis_cards, issue_cards = await asyncio.gather(
+                asyncio.to_thread(trello_manager.create_analysis_cards,
+                                  combined_analysis, repo_info["full_name"]),
+                asyncio.to_thread(trello_manager.create_issue_cards,
+                                  recent_issues, repo_info["full_name"]),
+            )
+
+            # Create summary card (needs the final card count)
             total_cards = len(analysis_cards) + len(issue_cards)
-            summary_card = trello_manager.create_summary_card(repo_info, combined_analysis, total_cards)
+            summary_card = await asyncio.to_thread(
+                trello_manager.create_summary_card, repo_info, combined_analysis, total_cards
+            )
             
             trello_results = {
                 "analysis_cards_created": len(analysis_cards),
@@ -260,54 +297,50 @@ async def analyze_repository(arguments: Dict[str, Any]) -> CallToolResult:
         elif create_trello_tasks and not trello_manager:
             trello_results = {"error": "Trello credentials not configured"}
         
-        # Generate summary
-        summary = f"""
-# Repository Analysis Results
+        # Generate summary from the precompiled template; appending
+        # fragments and joining once avoids quadratic str += rebuilds
+        # as the issue lists grow
+        parts = [_SUMMARY_TMPL.format_map({
+            "full_name": repo_info.get('full_name', 'Unknown'),
+            "description": repo_info.get('description', 'No description'),
+            "language": repo_info.get('language', 'Unknown'),
+            "stars": repo_info.get('stars', 0),
+            "forks": repo_info.get('forks', 0),
+            "open_issues": repo_info.get('open_issues', 0),
+            "score": combined_analysis.get('score', 0),
+            "n_issues": len(combined_analysis.get('issues', [])),
+            "n_suggestions": len(combined_analysis.get('suggestions', [])),
+            "files_analyzed": len(sample_files),
+            "total_files": len(structure.get('files', [])),
+            "has_readme": structure.get('has_readme', False),
+            "has_license": structure.get('has_license', False),
+            "has_requirements": structure.get('has_requirements', False),
+            "has_tests": structure.get('has_tests', False),
+            "has_cicd": structure.get('has_github_actions', False),
+        })]
 
-## Repository Information
-- **Name:** {repo_info.get('full_name', 'Unknown')}
-- **Description:** {repo_info.get('description', 'No description')}
-- **Language:** {repo_info.get('language', 'Unknown')}
-- **Stars:** {repo_info.get('stars', 0)}
-- **Forks:** {repo_info.get('forks', 0)}
-- **Open Issues:** {repo_info.get('open_issues', 0)}
-
-## Analysis Results
-- **Quality Score:** {combined_analysis.get('score', 0)}/100
-- **Issues Found:** {len(combined_analysis.get('issues', []))}
-- **Suggestions:** {len(combined_analysis.get('suggestions', []))}
-- **Files Analyzed:** {code_analysis.get('analyzed_files', 0)}/{code_analysis.get('total_files_found', 0)}
-
-## Repository Structure
-- **Has README:** {structure.get('has_readme', False)}
-- **Has License:** {structure.get('has_license', False)}
-- **Has Requirements:** {structure.get('has_requirements', False)}
-- **Has Tests:** {structure.get('has_tests', False)}
-- **Has CI/CD:** {structure.get('has_github_actions', False)}
-
-## Trello Integration
-"""
-        
         if trello_results.get("error"):
-            summary += f"- **Status:** {trello_results['error']}\n"
+            parts.append(f"- **Status:** {trello_results['error']}\n")
         else:
-            summary += f"- **Analysis Cards Created:** {trello_results.get('analysis_cards_created', 0)}\n"
-            summary += f"- **Issue Cards Created:** {trello_results.get('issue_cards_created', 0)}\n"
-            summary += f"- **Summary Card Created:** {trello_results.get('summary_card_created', False)}\n"
-            summary += f"- **Total Cards Created:** {trello_results.get('total_cards_created', 0)}\n"
-        
+            parts.append(f"- **Analysis Cards Created:** {trello_results.get('analysis_cards_created', 0)}\n")
+            parts.append(f"- **Issue Cards Created:** {trello_results.get('issue_cards_created', 0)}\n")
+            parts.append(f"- **Summary Card Created:** {trello_results.get('summary_card_created', False)}\n")
+            parts.append(f"- **Total Cards Created:** {trello_results.get('total_cards_created', 0)}\n")
+
         # Add detailed issues if any
         if combined_analysis.get("issues"):
-            summary += "\n## Issues Found\n"
-            for issue in combined_analysis["issues"][:10]:  # Show first 10 issues
-                summary += f"- **{issue.get('severity', 'medium').upper()}:** {issue.get('title', 'Unknown issue')}\n"
-        
+            parts.append("\n## Issues Found\n")
+            for issue in islice(combined_analysis["issues"], 10):  # Show first 10 issues
+                parts.append(f"- **{issue.get('severity', 'medium').upper()}:** {issue.get('title', 'Unknown issue')}\n")
+
         # Add suggestions if any
         if combined_analysis.get("suggestions"):
-            summary += "\n## Suggestions\n"
-            for suggestion in combined_analysis["suggestions"][:5]:  # Show first 5 suggestions
-                summary += f"- {suggestion.get('title', 'Unknown suggestion')}\n"
-        
+            parts.append("\n## Suggestions\n")
+            for suggestion in islice(combined_analysis["suggestions"], 5):  # Show first 5 suggestions
+                parts.append(f"- {suggestion.get('title', 'Unknown suggestion')}\n")
+
+        summary = "".join(parts)
+
         return CallToolResult(
             content=[
                 TextContent(
@@ -330,6 +363,7 @@ async def analyze_repository(arguments: Dict[str, Any]) -> CallToolResult:
 
 async def list_repositories(arguments: Dict[str, Any]) -> CallToolResult:
     """List repositories for a GitHub user or organization."""
+    github_analyzer = _get_github_analyzer()
     if not github_analyzer:
         return CallToolResult(
             content=[
@@ -364,22 +398,32 @@ async def list_repositories(arguments: Dict[str, Any]) -> CallToolResult:
                 ]
             )
         
-        # Format the results
-        result = f"# Repositories for {username}\n\n"
+        # Format the results, dropping absent optional fields (many
+        # repos have no description or language) instead of emitting
+        # placeholder lines over stdio
+        parts = [f"# Repositories for {username}\n\n"]
         for repo in repos[:20]:  # Show first 20 repositories
-            result += f"## {repo.get('name', 'Unknown')}\n"
-            result += f"- **Full Name:** {repo.get('full_name', 'Unknown')}\n"
-            result += f"- **Description:** {repo.get('description', 'No description')}\n"
-            result += f"- **Language:** {repo.get('language', 'Unknown')}\n"
-            result += f"- **Stars:** {repo.get('stars', 0)}\n"
-            result += f"- **Forks:** {repo.get('forks', 0)}\n"
-            result += f"- **URL:** {repo.get('url', 'N/A')}\n"
-            result += f"- **Private:** {repo.get('private', False)}\n"
-            result += f"- **Updated:** {repo.get('updated_at', 'Unknown')}\n\n"
-        
+            fields = (
+                ("Full Name", repo.get('full_name')),
+                ("Description", repo.get('description')),
+                ("Language", repo.get('language')),
+                ("Stars", repo.get('stars', 0)),
+                ("Forks", repo.get('forks', 0)),
+                ("URL", repo.get('url')),
+                ("Private", repo.get('private', False)),
+                ("Updated", repo.get('updated_at')),
+            )
+            parts.append("\n".join(
+                [f"## {repo.get('name', 'Unknown')}"]
+                + [f"- **{label}:** {value}" for label, value in fields
+                   if value is not None and value != ""]
+            ) + "\n\n")
+
         if len(repos) > 20:
-            result += f"... and {len(repos) - 20} more repositories\n"
-        
+            parts.append(f"... and {len(repos) - 20} more repositories\n")
+
+        result = "".join(parts)
+
         return CallToolResult(
             content=[
                 TextContent(
@@ -402,6 +446,7 @@ async def list_repositories(arguments: Dict[str, Any]) -> CallToolResult:
 
 async def get_repository_info(arguments: Dict[str, Any]) -> CallToolResult:
     """Get detailed information about a specific GitHub repository."""
+    github_analyzer = _get_github_analyzer()
     if not github_analyzer:
         return CallToolResult(
             content=[
@@ -436,31 +481,35 @@ async def get_repository_info(arguments: Dict[str, Any]) -> CallToolResult:
                 ]
             )
         
-        # Format the results
-        result = f"# Repository Information\n\n"
-        result += f"## {repo_info.get('name', 'Unknown')}\n"
-        result += f"- **Full Name:** {repo_info.get('full_name', 'Unknown')}\n"
-        result += f"- **Description:** {repo_info.get('description', 'No description')}\n"
-        result += f"- **Language:** {repo_info.get('language', 'Unknown')}\n"
-        result += f"- **Stars:** {repo_info.get('stars', 0)}\n"
-        result += f"- **Forks:** {repo_info.get('forks', 0)}\n"
-        result += f"- **Open Issues:** {repo_info.get('open_issues', 0)}\n"
-        result += f"- **License:** {repo_info.get('license', 'No license')}\n"
-        result += f"- **Size:** {repo_info.get('size', 0)} KB\n"
-        result += f"- **Default Branch:** {repo_info.get('default_branch', 'Unknown')}\n"
-        result += f"- **Created:** {repo_info.get('created_at', 'Unknown')}\n"
-        result += f"- **Updated:** {repo_info.get('updated_at', 'Unknown')}\n"
-        result += f"- **URL:** {repo_info.get('url', 'N/A')}\n"
-        result += f"- **Clone URL:** {repo_info.get('clone_url', 'N/A')}\n"
-        
-        if repo_info.get('topics'):
-            result += f"- **Topics:** {', '.join(repo_info['topics'])}\n"
-        
-        result += f"- **Has Wiki:** {repo_info.get('has_wiki', False)}\n"
-        result += f"- **Has Issues:** {repo_info.get('has_issues', False)}\n"
-        result += f"- **Has Projects:** {repo_info.get('has_projects', False)}\n"
-        result += f"- **Has Downloads:** {repo_info.get('has_downloads', False)}\n"
-        
+        # Format the results; optional fields that are absent (license,
+        # description, topics, ...) are skipped rather than rendered as
+        # placeholders, while zeroes and booleans still show
+        fields = (
+            ("Full Name", repo_info.get('full_name')),
+            ("Description", repo_info.get('description')),
+            ("Language", repo_info.get('language')),
+            ("Stars", repo_info.get('stars', 0)),
+            ("Forks", repo_info.get('forks', 0)),
+            ("Open Issues", repo_info.get('open_issues', 0)),
+            ("License", repo_info.get('license')),
+            ("Size", f"{repo_info.get('size', 0)} KB"),
+            ("Default Branch", repo_info.get('default_branch')),
+            ("Created", repo_info.get('created_at')),
+            ("Updated", repo_info.get('updated_at')),
+            ("URL", repo_info.get('url')),
+            ("Clone URL", repo_info.get('clone_url')),
+            ("Topics", ', '.join(repo_info.get('topics') or [])),
+            ("Has Wiki", repo_info.get('has_wiki', False)),
+            ("Has Issues", repo_info.get('has_issues', False)),
+            ("Has Projects", repo_info.get('has_projects', False)),
+            ("Has Downloads", repo_info.get('has_downloads', False)),
+        )
+        result = "\n".join(
+            ["# Repository Information\n", f"## {repo_info.get('name', 'Unknown')}"]
+            + [f"- **{label}:** {value}" for label, value in fields
+               if value is not None and value != ""]
+        ) + "\n"
+
         return CallToolResult(
             content=[
                 TextContent(
@@ -483,6 +532,7 @@ async def get_repository_info(arguments: Dict[str, Any]) -> CallToolResult:
 
 async def create_trello_card(arguments: Dict[str, Any]) -> CallToolResult:
     """Create a single Trello card."""
+    trello_manager = _get_trello_manager()
     if not trello_manager:
         return CallToolResult(
             content=[
@@ -526,14 +576,16 @@ async def create_trello_card(arguments: Dict[str, Any]) -> CallToolResult:
                 ]
             )
         
-        result = f"# Trello Card Created Successfully\n\n"
-        result += f"## Card Details\n"
-        result += f"- **Title:** {card.get('name', 'Unknown')}\n"
-        result += f"- **Description:** {card.get('description', 'No description')}\n"
-        result += f"- **List:** {card.get('list_name', 'Unknown')}\n"
-        result += f"- **Labels:** {', '.join(card.get('labels', []))}\n"
-        result += f"- **URL:** {card.get('url', 'N/A')}\n"
-        result += f"- **ID:** {card.get('id', 'Unknown')}\n"
+        result = (
+            f"# Trello Card Created Successfully\n\n"
+            f"## Card Details\n"
+            f"- **Title:** {card.get('name', 'Unknown')}\n"
+            f"- **Description:** {card.get('description', 'No description')}\n"
+            f"- **List:** {card.get('list_name', 'Unknown')}\n"
+            f"- **Labels:** {', '.join(card.get('labels', []))}\n"
+            f"- **URL:** {card.get('url', 'N/A')}\n"
+            f"- **ID:** {card.get('id', 'Unknown')}\n"
+        )
         
         return CallToolResult(
             content=[
@@ -555,6 +607,55 @@ async def create_trello_card(arguments: Dict[str, Any]) -> CallToolResult:
         )
 
 
+# Markdown skeleton for the analyze_repository summary, filled with one
+# format_map call per request instead of interleaved f-string appends
+_SUMMARY_TMPL = """
+# Repository Analysis Results
+
+## Repository Information
+- **Name:** {full_name}
+- **Description:** {description}
+- **Language:** {language}
+- **Stars:** {stars}
+- **Forks:** {forks}
+- **Open Issues:** {open_issues}
+
+## Analysis Results
+- **Quality Score:** {score}/100
+- **Issues Found:** {n_issues}
+- **Suggestions:** {n_suggestions}
+- **Files Analyzed:** {files_analyzed}/{total_files}
+
+## Repository Structure
+- **Has README:** {has_readme}
+- **Has License:** {has_license}
+- **Has Requirements:** {has_requirements}
+- **Has Tests:** {has_tests}
+- **Has CI/CD:** {has_cicd}
+
+## Trello Integration
+"""
+
+# O(1) dispatch table for tool calls; registering a new tool is one
+# entry here plus its Tool schema above
+_TOOL_DISPATCH = {
+    "analyze_repository": analyze_repository,
+    "list_repositories": list_repositories,
+    "get_repository_info": get_repository_info,
+    "create_trello_card": create_trello_card,
+}
+
+
+# uvloop's libuv-backed loop is markedly faster than the default
+# selector loop for I/O-heavy servers like this one; it's optional, so
+# fall back silently to the stdlib loop when it isn't installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
 async def main():
     """Run the MCP server."""
     # Run the server
@@ -2,4 +2,8 @@
 Utils package
 
 Contains utility functions and helpers.
-""" 
\ No newline at end of file
+"""
+
+from .cache import DiskCache
+
+__all__ = ['DiskCache']
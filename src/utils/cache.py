@@ -0,0 +1,67 @@
+"""
+Disk Cache
+
+Small JSON-backed TTL cache for API responses, so repeated runs against
+the same repository don't refetch identical data or burn rate limit.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class DiskCache:
+    """JSON-file-backed cache with per-read TTL expiry."""
+
+    # Shared across instances: several components keep their own
+    # DiskCache over the same default file, and the AI analyzer can
+    # write from two provider threads at once.
+    _lock = threading.Lock()
+
+    def __init__(self, path: str = ".mcp_cache.json"):
+        """Load existing cache entries from disk if present."""
+        self.path = Path(path)
+        self._entries = {}
+        if self.path.exists():
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def get(self, key: str, max_age: float = 900) -> Optional[Any]:
+        """Return the cached body for key, or None if missing or older than max_age seconds."""
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+        if time.time() - entry["fetched_at"] > max_age:
+            return None
+        return entry["body"]
+
+    def set(self, key: str, body: Any) -> None:
+        """Store a JSON-serializable body under key and persist to disk."""
+        with self._lock:
+            self._merge_from_disk()
+            self._entries[key] = {"fetched_at": time.time(), "body": body}
+            try:
+                self.path.write_text(json.dumps(self._entries))
+            except (OSError, TypeError):
+                pass
+
+    def _merge_from_disk(self) -> None:
+        """Fold newer on-disk entries into memory before writing.
+
+        Without this, each instance would rewrite the file from its own
+        snapshot and erase keys other instances persisted since load.
+        """
+        if not self.path.exists():
+            return
+        try:
+            on_disk = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        for key, entry in on_disk.items():
+            current = self._entries.get(key)
+            if current is None or entry.get("fetched_at", 0) > current.get("fetched_at", 0):
+                self._entries[key] = entry
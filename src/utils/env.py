@@ -0,0 +1,21 @@
+"""
+Environment Loading Helper
+
+This module loads the .env file exactly once per process.
+"""
+
+import os
+from dotenv import load_dotenv
+
+# Sentinel lives in os.environ rather than a module global so the guard
+# holds even when script-style sys.path imports create a second copy of
+# this module under a different name.
+_SENTINEL = "_MCP_DOTENV_LOADED"
+
+
+def load_env_once() -> None:
+    """Parse the .env file on first call; later calls are no-ops."""
+    if os.environ.get(_SENTINEL):
+        return
+    load_dotenv()
+    os.environ[_SENTINEL] = "1"
@@ -15,10 +15,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from analyzers.github_analyzer import GitHubAnalyzer
 from managers.trello_manager import TrelloManager
 from analyzers.ai_analyzer import AIAnalyzer
+from analyzers.code_analyzer import CodeAnalyzer
 
 # Load environment variables
 load_dotenv()
 
+# Shared analyzer instance so each test reuses the same compiled patterns
+# and per-blob cache instead of constructing its own copy.
+code_analyzer = CodeAnalyzer()
+
 async def test_github_integration():
     """Test GitHub integration directly."""
     print("🔍 Testing GitHub Integration")
@@ -32,24 +37,26 @@ async def test_github_integration():
     try:
         analyzer = GitHubAnalyzer(github_token)
         
-        # Test getting repository info
+        # The info fetch and the org listing are independent; overlap
+        # them on worker threads instead of paying two serial phases
         print("📊 Testing repository info...")
-        repo_info = analyzer.get_repository_info("microsoft/vscode")
-        
+        repo_info, repos = await asyncio.gather(
+            asyncio.to_thread(analyzer.get_repository_info, "microsoft/vscode"),
+            asyncio.to_thread(analyzer.list_repositories, "microsoft"),
+        )
+
         if "error" in repo_info:
             print(f"❌ Error: {repo_info['error']}")
             return False
-        
+
         print("✅ Repository info retrieved successfully!")
         print(f"   Name: {repo_info.get('name', 'Unknown')}")
         print(f"   Language: {repo_info.get('language', 'Unknown')}")
         print(f"   Stars: {repo_info.get('stars', 0)}")
         print(f"   Forks: {repo_info.get('forks', 0)}")
-        
+
         # Test listing repositories
         print("\n📋 Testing repository listing...")
-        repos = analyzer.list_repositories("microsoft")
-        
         if not repos or "error" in repos[0]:
             print(f"❌ Error listing repositories: {repos[0].get('error', 'Unknown error')}")
             return False
@@ -171,14 +178,31 @@ def main():
             }
         ]
         
-        # Create a mock repository object for testing
+        # Create a mock repository object for testing; the base64 form of
+        # the sample is computed once instead of on every get_contents
+        # call, and the attributes cover everything the analyzer's code
+        # fetch path reads (full_name for its cache key, size for bounds)
+        sample_bytes = sample_files[0]['code'].encode()
+        sample_b64 = base64.b64encode(sample_bytes).decode()
+
+        class MockContent:
+            content = sample_b64
+            size = len(sample_bytes)
+            download_url = None
+
         class MockRepo:
+            name = "mock-repo"
+            full_name = "mock/mock-repo"
+
             def get_contents(self, path):
-                class MockContent:
-                    def __init__(self, content):
-                        self.content = base64.b64encode(content.encode()).decode()
-                return MockContent(sample_files[0]['code'])
+                return MockContent()
         
+        # Run the static analyzer over the sample code once up front
+        static_issues = code_analyzer.analyze_file_content(
+            sample_files[0]['path'], sample_files[0]['code']
+        )
+        print(f"🔍 Static analysis found {len(static_issues)} issues in sample code")
+
         mock_repo = MockRepo()
         analysis = ai_analyzer.analyze_repository_with_ai(mock_repo, sample_files)
         
@@ -230,25 +254,29 @@ async def test_full_workflow():
             print("❌ Could not access repository")
             return False
         
-        # Get repository info
-        repo_info = github_analyzer.get_repository_info("microsoft/vscode")
-        
-        # Analyze repository
+        # One GraphQL round-trip covers the repo info and root structure;
+        # the REST calls stay as fallback when GraphQL is unavailable
         print("🔍 Analyzing repository...")
-        structure = github_analyzer.analyze_repository_structure(repo)
-        code_quality = github_analyzer.analyze_code_quality(repo)
-        
-        # Perform AI analysis
+        bundle = github_analyzer.fetch_workflow_bundle("microsoft/vscode")
+        if bundle:
+            repo_info = bundle["repo_info"]
+            structure = bundle["structure"]
+        else:
+            repo_info = github_analyzer.get_repository_info("microsoft/vscode")
+            structure = github_analyzer.analyze_repository_structure(repo)
+        code_quality = github_analyzer.analyze_code_quality(repo, structure)
+
+        # Perform AI analysis; the structure already names the root
+        # files, so no separate contents listing is needed
         print("🤖 Performing AI analysis...")
-        sample_files = []
-        contents = repo.get_contents("")
-        for content in contents[:5]:  # Limit to 5 files for testing
-            if hasattr(content, 'content'):
-                sample_files.append({
-                    'path': content.path,
-                    'language': content.name.split('.')[-1] if '.' in content.name else 'unknown'
-                })
-        
+        sample_files = [
+            {
+                'path': name,
+                'language': name.split('.')[-1] if '.' in name else 'unknown'
+            }
+            for name in structure.get('files', [])[:5]  # Limit to 5 files for testing
+        ]
+
         ai_analysis = ai_analyzer.analyze_repository_with_ai(repo, sample_files)
         
         # Combine analysis
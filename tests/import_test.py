@@ -0,0 +1,67 @@
+"""
+Import Smoke Test
+
+This script verifies that every module loads in both import styles:
+package-style (how the MCP server resolves its relative imports) and
+script-style (how the test scripts import with src/ on sys.path).
+No network access or credentials are required.
+"""
+
+import importlib
+import os
+import sys
+
+_ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(_ROOT)
+sys.path.append(os.path.join(_ROOT, 'src'))
+
+
+def import_test():
+    """Import every module both ways and exercise the lazy factories."""
+    print("📦 Import Smoke Test")
+    print("=" * 30)
+
+    modules = [
+        "src.mcp_server",
+        "src.analyzers.github_analyzer",
+        "src.analyzers.ai_analyzer",
+        "src.analyzers.code_analyzer",
+        "src.managers.trello_manager",
+        "src.utils.cache",
+        "src.utils.env",
+    ]
+
+    all_passed = True
+    for name in modules:
+        # Package-style, then the script-style spelling of the same module.
+        # mcp_server is package-only: its relative imports need a parent.
+        spellings = (name,) if name == "src.mcp_server" else (name, name.split('.', 1)[1])
+        for spelling in spellings:
+            try:
+                importlib.import_module(spelling)
+                print(f"✅ import {spelling}")
+            except Exception as e:
+                print(f"❌ import {spelling}: {e}")
+                all_passed = False
+
+    # The server builds its components lazily inside the first tool call;
+    # invoke the factories so their deferred imports run now, not there.
+    try:
+        import src.mcp_server as mcp_server
+        mcp_server._get_github_analyzer()
+        mcp_server._get_trello_manager()
+        mcp_server._get_ai_analyzer()
+        print("✅ mcp_server lazy factories load")
+    except Exception as e:
+        print(f"❌ mcp_server lazy factories: {e}")
+        all_passed = False
+
+    if all_passed:
+        print("\n✨ All imports resolved!")
+    else:
+        print("\n⚠️  Some imports failed. Check the output above.")
+    return all_passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if import_test() else 1)